@@ -7,31 +7,55 @@ Commands:
     all         - Extract both profiles
 """
 
-import json
+import os
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group
+from rich.highlighter import ReprHighlighter
+from rich.json import JSON
+from rich.table import Column, Table
 from rich.panel import Panel
+from rich.text import Text
 
-from extractors import (
-    NutritionExtractor,
-    AminoacidExtractor,
-    ExtractionResult,
-    BrandExtractionResult,
-    extract_brand,
-    detect_profile_type,
-    get_brand_from_path,
-    EXTRACTORS,
-)
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from extractors import ExtractionResult, BrandExtractionResult
+
+# Extractors (pydantic, jsonschema, LLM SDKs) are imported inside the commands
+# that use them, so `--help`, `check` and scoring commands start quickly.
 
 console = Console()
 
 # Default output directory
 DEFAULT_OUTPUT_DIR = Path("output")
 
+# Column templates for the CLI tables, built once and copied per table
+FIELD_COLUMNS = (Column("Field", style="cyan"), Column("Value", style="green"))
+MODE_SCORE_COLUMNS = (Column("Mode", style="cyan"), Column("Score", justify="right"), Column("Status"))
+LEADERBOARD_COLUMNS = (
+    Column("Rank", justify="right", style="cyan"),
+    Column("Brand"),
+    Column("Score", justify="right"),
+    Column("Status"),
+)
+SKILLS_COLUMNS = (
+    Column("Command", style="cyan"),
+    Column("Extractor", style="green"),
+    Column("Skill Files", style="dim"),
+)
+
+
+def new_table(columns: tuple[Column, ...], **kwargs) -> Table:
+    """Create a table from column templates.
+    
+    Columns store their cells, so each table gets fresh copies.
+    """
+    return Table(*(column.copy() for column in columns), **kwargs)
+
 
 def ensure_output_dir(brand_name: str) -> Path:
     """Create and return output directory for a brand."""
@@ -40,92 +64,131 @@ def ensure_output_dir(brand_name: str) -> Path:
     return output_dir
 
 
-def display_result(result: ExtractionResult, verbose: bool = False):
+def save_result(result: "BaseModel", output_path: Path) -> None:
+    """Serialize a result model to JSON and write it atomically.
+    
+    The JSON is written to a per-process sibling temp file and moved into
+    place, so an interrupted run never leaves a truncated result behind.
+    The write is not fsynced, so this does not guard against power loss.
+    
+    Args:
+        result: Pydantic model to persist
+        output_path: Destination JSON file
+    """
+    tmp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+        tmp_path.replace(output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _iter_field_rows(fields: dict) -> Iterator[tuple[str, str]]:
+    """Yield (dotted path, display value) rows for nested extracted fields.
+    
+    Walks depth-first with an explicit stack of iterators, keeping path
+    components as tuples and joining them once per leaf.
+    """
+    stack = [((), iter(fields.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for field, value in items:
+            if isinstance(value, dict):
+                stack.append(((*prefix, field), iter(value.items())))
+                break
+            yield ".".join((*prefix, field)), str(value) if value is not None else "[dim]null[/]"
+        else:
+            stack.pop()
+
+
+def display_result(result: "ExtractionResult", verbose: bool = False):
     """Display extraction result in a formatted table."""
     status_color = "green" if result.valid else "red"
     status_text = "✓ Valid" if result.valid else "✗ Invalid"
     
-    console.print(Panel(
+    renderables = [Panel(
         f"[bold {status_color}]{status_text}[/] | Provider: [cyan]{result.provider}[/] | "
         f"Model: [cyan]{result.model}[/] | "
         f"Confidence: [yellow]{result.quality.get('extraction_confidence', 'N/A')}[/]",
         title=f"[{result.profile_type}] {result.product_id}",
         border_style=status_color,
-    ))
+    )]
     
     # Extracted fields table
-    table = Table(title="Extracted Fields", show_header=True)
-    table.add_column("Field", style="cyan")
-    table.add_column("Value", style="green")
-    
-    def add_fields(fields: dict, prefix: str = ""):
-        for field, value in fields.items():
-            if isinstance(value, dict):
-                add_fields(value, f"{prefix}{field}.")
-            else:
-                display_value = str(value) if value is not None else "[dim]null[/]"
-                table.add_row(f"{prefix}{field}", display_value)
+    table = new_table(FIELD_COLUMNS, title="Extracted Fields", show_header=True)
     
-    add_fields(result.extracted_fields)
-    console.print(table)
+    for field_path, display_value in _iter_field_rows(result.extracted_fields):
+        table.add_row(field_path, display_value)
+    renderables.append(table)
     
     # Show warnings if any
     if result.quality.get("warnings"):
-        console.print("\n[yellow]⚠ Warnings:[/]")
-        for warning in result.quality["warnings"]:
-            console.print(f"  • {warning}")
+        renderables.append("\n[yellow]⚠ Warnings:[/]")
+        renderables.extend(f"  • {warning}" for warning in result.quality["warnings"])
     
     # Show validation errors if any
     if result.validation_errors:
-        console.print("\n[red]✗ Validation Errors:[/]")
-        for error in result.validation_errors:
-            console.print(f"  • {error}")
+        renderables.append("\n[red]✗ Validation Errors:[/]")
+        renderables.extend(f"  • {error}" for error in result.validation_errors)
     
     # Verbose: show raw evidence
     if verbose:
-        console.print("\n[dim]Raw Evidence:[/]")
-        console.print_json(json.dumps(result.raw_evidence, indent=2))
+        renderables.append("\n[dim]Raw Evidence:[/]")
+        renderables.append(JSON.from_data(result.raw_evidence, indent=2))
+    
+    console.print(Group(*renderables))
 
 
-def display_brand_result(result: BrandExtractionResult):
+def display_brand_result(result: "BrandExtractionResult"):
     """Display brand extraction result."""
-    console.print(Panel(
+    renderables = [Panel(
         f"[bold green]{result.brand}[/] | {result.extraction_timestamp}",
         title="Brand Extraction Complete",
         border_style="green",
-    ))
+    )]
     
     # Nutrients summary
     if result.nutrients:
         nutrients = result.nutrients.get("extracted_fields", {})
         valid = result.nutrients.get("valid", False)
         status = "[green]✓[/]" if valid else "[red]✗[/]"
-        console.print(f"\n{status} [cyan]Nutrients:[/]")
-        console.print(f"  Serving: {nutrients.get('serving_size_g', 'N/A')}g")
-        console.print(f"  Protein: {nutrients.get('protein_g_per_serving', 'N/A')}g")
-        console.print(f"  Energy: {nutrients.get('energy_kcal_per_serving', 'N/A')} kcal")
+        renderables.extend([
+            f"\n{status} [cyan]Nutrients:[/]",
+            f"  Serving: {nutrients.get('serving_size_g', 'N/A')}g",
+            f"  Protein: {nutrients.get('protein_g_per_serving', 'N/A')}g",
+            f"  Energy: {nutrients.get('energy_kcal_per_serving', 'N/A')} kcal",
+        ])
     else:
-        console.print("\n[dim]Nutrients: Not found/extracted[/]")
+        renderables.append("\n[dim]Nutrients: Not found/extracted[/]")
     
     # Amino acids summary
     if result.aminoacids:
         amino = result.aminoacids.get("extracted_fields", {})
         valid = result.aminoacids.get("valid", False)
         status = "[green]✓[/]" if valid else "[red]✗[/]"
-        console.print(f"\n{status} [cyan]Amino Acids:[/]")
         eaas = amino.get("eaas", {})
         bcaas = eaas.get("bcaas", {})
-        console.print(f"  EAAs: {eaas.get('total_g', 'N/A')}g")
-        console.print(f"  BCAAs: {bcaas.get('total_g', 'N/A')}g")
+        renderables.extend([
+            f"\n{status} [cyan]Amino Acids:[/]",
+            f"  EAAs: {eaas.get('total_g', 'N/A')}g",
+            f"  BCAAs: {bcaas.get('total_g', 'N/A')}g",
+        ])
     else:
-        console.print("\n[dim]Amino Acids: Not found/extracted[/]")
+        renderables.append("\n[dim]Amino Acids: Not found/extracted[/]")
+    
+    console.print(Group(*renderables))
 
 
 def resolve_image_path(path: Path, extractor_class) -> Path:
     """Resolve path to image: if directory, find the appropriate image."""
-    if path.is_file():
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        raise click.ClickException(f"Path does not exist: {path}")
+    
+    if stat.S_ISREG(mode):
         return path
-    elif path.is_dir():
+    elif stat.S_ISDIR(mode):
         img = extractor_class.find_image(path)
         if img:
             return img
@@ -177,7 +240,7 @@ def full(brand_dir: str, provider: str, model: Optional[str], weight: float, pri
         raise click.ClickException("--force requires --push to be specified.")
     
     # Import dependencies
-    from extractors import ProductInfo
+    from extractors import ProductInfo, extract_brand
     from scorer import Scorer
     from generate_explanations import generate_brand_explanations
     
@@ -217,20 +280,17 @@ def full(brand_dir: str, provider: str, model: Optional[str], weight: float, pri
             raise click.Abort()
         
         # Add product info
-        product_info = {
-            "weight_kg": weight,
-            "price_inr": price,
-            "price_per_kg": round(price / weight, 2)
-        }
-        
-        if result.nutrients:
-            serving_size_g = result.nutrients.get("extracted_fields", {}).get("serving_size_g")
-            if serving_size_g:
-                servings_per_pack = (weight * 1000) / serving_size_g
-                product_info["servings_per_pack"] = round(servings_per_pack, 1)
-                product_info["price_per_serving"] = round(price / servings_per_pack, 2)
+        serving_size_g = (result.nutrients or {}).get("extracted_fields", {}).get("serving_size_g")
+        servings_per_pack = (weight * 1000) / serving_size_g if serving_size_g else None
+        has_servings = servings_per_pack is not None
         
-        result.product_info = ProductInfo(**product_info)
+        result.product_info = ProductInfo(
+            weight_kg=weight,
+            price_inr=price,
+            price_per_kg=round(price / weight, 2),
+            servings_per_pack=round(servings_per_pack, 1) if has_servings else None,
+            price_per_serving=round(price / servings_per_pack, 2) if has_servings else None,
+        )
         
         # Step 2: Compute scores
         console.print("[cyan]Step 2/4:[/] Computing scores...")
@@ -243,15 +303,14 @@ def full(brand_dir: str, provider: str, model: Optional[str], weight: float, pri
         console.print("[cyan]Step 3/4:[/] Generating AI explanations...")
         with console.status("[bold green]Generating explanations..."):
             explanations = generate_brand_explanations(brand_name, result_dict, scores)
-        result_dict["explanations"] = explanations
+        result.explanations = explanations
         console.print(f"  ✓ Generated explanations for all modes")
         
         # Save locally
         console.print("[cyan]Step 4/4:[/] Saving results...")
         output_dir = ensure_output_dir(brand_name)
         output_path = output_dir / f"{brand_name}.json"
-        with open(output_path, "w") as f:
-            json.dump(result_dict, f, indent=2)
+        save_result(result, output_path)
         console.print(f"  ✓ Saved to {output_path}")
         
         # Push to Supabase if requested
@@ -289,6 +348,8 @@ def nutrients(path: str, provider: str, model: Optional[str], output: Optional[s
     
     Output saved to: output/<brand>/nutrients.json
     """
+    from extractors import NutritionExtractor, get_brand_from_path
+    
     path = Path(path)
     
     try:
@@ -300,6 +361,7 @@ def nutrients(path: str, provider: str, model: Optional[str], output: Optional[s
         console.print(f"[dim]Provider: {provider} | Model: {model or 'default'}[/]\n")
         
         extractor = NutritionExtractor(provider=provider, model=model)
+        extractor.warm()
         
         with console.status("[bold green]Extracting..."):
             result = extractor.extract(image_path, product_id)
@@ -313,8 +375,7 @@ def nutrients(path: str, provider: str, model: Optional[str], output: Optional[s
             output_dir = ensure_output_dir(brand)
             output_path = output_dir / "nutrients.json"
         
-        with open(output_path, "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        save_result(result, output_path)
         console.print(f"\n[green]✓ Saved to {output_path}[/]")
         
     except Exception as e:
@@ -337,6 +398,8 @@ def aminoacids(path: str, provider: str, model: Optional[str], output: Optional[
     
     Output saved to: output/<brand>/aminoacids.json
     """
+    from extractors import AminoacidExtractor, get_brand_from_path
+    
     path = Path(path)
     
     try:
@@ -348,6 +411,7 @@ def aminoacids(path: str, provider: str, model: Optional[str], output: Optional[
         console.print(f"[dim]Provider: {provider} | Model: {model or 'default'}[/]\n")
         
         extractor = AminoacidExtractor(provider=provider, model=model)
+        extractor.warm()
         
         with console.status("[bold green]Extracting..."):
             result = extractor.extract(image_path, product_id)
@@ -361,8 +425,7 @@ def aminoacids(path: str, provider: str, model: Optional[str], output: Optional[
             output_dir = ensure_output_dir(brand)
             output_path = output_dir / "aminoacids.json"
         
-        with open(output_path, "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        save_result(result, output_path)
         console.print(f"\n[green]✓ Saved to {output_path}[/]")
         
     except Exception as e:
@@ -386,7 +449,8 @@ def check(provider: str):
     key = os.getenv(key_name)
     
     if key:
-        masked = key[:8] + "..." + key[-4:]
+        # A fixed prefix only; short keys are not shown at all
+        masked = f"{key[:4]}..." if len(key) > 16 else "***"
         console.print(f"[green]✓ {key_name}:[/] {masked}")
     else:
         console.print(f"[red]✗ {key_name} not set[/]")
@@ -396,12 +460,9 @@ def check(provider: str):
 @cli.command()
 def skills():
     """List available extraction skills."""
-    console.print("\n[bold]Available Extractors:[/]\n")
+    from extractors import EXTRACTORS
     
-    table = Table(show_header=True)
-    table.add_column("Command", style="cyan")
-    table.add_column("Extractor", style="green")
-    table.add_column("Skill Files", style="dim")
+    table = new_table(SKILLS_COLUMNS, show_header=True)
     
     for profile_type, extractor_cls in EXTRACTORS.items():
         table.add_row(
@@ -410,7 +471,7 @@ def skills():
             f"{extractor_cls.PROMPT_FILE}, {extractor_cls.SCHEMA_FILE}",
         )
     
-    console.print(table)
+    console.print(Group("\n[bold]Available Extractors:[/]\n", table))
 
 
 # ============================================================================
@@ -435,14 +496,37 @@ MODE_EXPLANATIONS = {
 }
 
 
+# Parse the explanation markup once, highlighted the way console.print would
+_MODE_RENDERABLES = {
+    m: ReprHighlighter()(Text.from_markup(explanation))
+    for m, explanation in MODE_EXPLANATIONS.items()
+}
+
+# (minimum score, style) buckets for colouring scores, checked in order
+SCORE_STYLES = ((0.7, "green"), (0.5, "yellow"))
+
+# Leaderboard status for the top three ranks
+MEDAL_STATUSES = {1: "[green]🥇 Best[/]", 2: "[yellow]🥈[/]", 3: "[yellow]🥉[/]"}
+
+
+def score_style(score_val: float) -> str:
+    """Return the display style for a score."""
+    for threshold, style in SCORE_STYLES:
+        if score_val >= threshold:
+            return style
+    return "red"
+
+
 def display_mode_explanation(mode: Optional[str] = None):
     """Display explanation of scoring logic for a mode."""
     if mode:
-        console.print(f"\n{MODE_EXPLANATIONS[mode]}\n")
+        console.print(Group("", _MODE_RENDERABLES[mode], ""))
     else:
-        for m, explanation in MODE_EXPLANATIONS.items():
-            console.print(f"\n{explanation}")
-        console.print("")
+        lines = []
+        for explanation in _MODE_RENDERABLES.values():
+            lines.extend(("", explanation))
+        lines.append("")
+        console.print(Group(*lines))
 
 
 @cli.command()
@@ -460,31 +544,36 @@ def score(brand: Optional[str], mode: Optional[str], verbose: bool, no_explain:
       analyse score --mode cut         # Score all for cutting
       analyse score --no-explain       # Hide explanation
     """
-    from scorer import Scorer, score_all_brands
+    from scorer import MODES, Scorer, score_all_brands
     
-    # Show explanation by default
-    if not no_explain:
-        display_mode_explanation(mode)
-    
-    scorer = Scorer()
-    
-    if brand:
-        # Score specific brand
-        json_path = DEFAULT_OUTPUT_DIR / brand / f"{brand}.json"
-        if not json_path.exists():
-            console.print(f"[red]✗ Brand not found: {json_path}[/]")
-            raise click.Abort()
+    # Buffer the whole report so it reaches the terminal in one write
+    with console:
+        # Show explanation by default
+        if not no_explain:
+            display_mode_explanation(mode)
         
-        scores = scorer.score_brand_from_file(json_path)
-        display_brand_scores(scores, mode, verbose)
-    else:
-        # Score all brands
-        results = score_all_brands(DEFAULT_OUTPUT_DIR)
-        console.print(f"\n[bold]Scoring {len(results)} brands[/]\n")
+        scorer = Scorer()
+        modes = (mode,) if mode else MODES
         
-        for scores in results:
+        if brand:
+            # Score specific brand
+            json_path = DEFAULT_OUTPUT_DIR / brand / f"{brand}.json"
+            try:
+                data = scorer.load_brand_data(json_path)
+            except FileNotFoundError:
+                console.print(f"[red]✗ Brand not found: {json_path}[/]")
+                raise click.Abort()
+            
+            scores = scorer.score_brand(data, detailed=verbose, modes=modes)
             display_brand_scores(scores, mode, verbose)
-            console.print("")
+        else:
+            # Score all brands
+            results = score_all_brands(DEFAULT_OUTPUT_DIR, detailed=verbose, modes=modes)
+            console.print(f"\n[bold]Scoring {len(results)} brands[/]\n")
+            
+            for scores in results:
+                display_brand_scores(scores, mode, verbose)
+                console.print("")
 
 
 
@@ -493,66 +582,59 @@ def display_brand_scores(scores, mode: Optional[str], verbose: bool):
     from scorer import BrandScores
     
     modes_to_show = [mode] if mode else ["cut", "bulk", "clean"]
+    mode_scores = {m_name: getattr(scores, m_name + "_score") for m_name in modes_to_show}
     
     # Header with brand name and spiking status
     spiking_status = "[red]⚠ SPIKING SUSPECTED[/]" if scores.amino_spiking.suspected else ""
-    console.print(Panel(
+    renderables = [Panel(
         f"[bold]{scores.brand}[/] {spiking_status}",
         border_style="cyan"
-    ))
+    )]
     
     # Show metrics summary
     m = scores.metrics
-    console.print(f"  Protein: [green]{m.protein_pct:.1f}%[/] | "
-                  f"Per 100kcal: [green]{m.protein_per_100_kcal:.1f}g[/] | "
-                  f"Leucine: [green]{m.leucine_g_per_serving or 'N/A'}g[/]")
+    renderables.append(f"  Protein: [green]{m.protein_pct:.1f}%[/] | "
+                       f"Per 100kcal: [green]{m.protein_per_100_kcal:.1f}g[/] | "
+                       f"Leucine: [green]{m.leucine_g_per_serving or 'N/A'}g[/]")
     
     if m.eaas_pct:
-        console.print(f"  EAAs: [yellow]{m.eaas_pct*100:.1f}%[/] of protein | "
-                      f"Non-protein macros: [yellow]{m.non_protein_macros_g:.1f}g[/] | "
-                      f"Sodium: [yellow]{m.sodium_mg}mg[/]")
+        renderables.append(f"  EAAs: [yellow]{m.eaas_pct*100:.1f}%[/] of protein | "
+                           f"Non-protein macros: [yellow]{m.non_protein_macros_g:.1f}g[/] | "
+                           f"Sodium: [yellow]{m.sodium_mg}mg[/]")
     
     # Show amino spiking rules triggered
     if scores.amino_spiking.triggered_rules:
-        console.print(f"  [dim]Spiking rules: {', '.join(scores.amino_spiking.triggered_rules)}[/]")
+        renderables.append(f"  [dim]Spiking rules: {', '.join(scores.amino_spiking.triggered_rules)}[/]")
     
     # Show mode scores
-    table = Table(show_header=True)
-    table.add_column("Mode", style="cyan")
-    table.add_column("Score", justify="right")
-    table.add_column("Status")
+    table = new_table(MODE_SCORE_COLUMNS, show_header=True)
     
-    for m_name in modes_to_show:
-        mode_score = getattr(scores, f"{m_name}_score")
+    for m_name, mode_score in mode_scores.items():
         if mode_score:
             if mode_score.hard_rejected:
                 score_str = "[red]REJECTED[/]"
                 status = f"[red]{mode_score.rejection_reason}[/]"
             else:
                 score_val = mode_score.total_score
-                if score_val >= 0.7:
-                    score_str = f"[green]{score_val:.2f}[/]"
-                elif score_val >= 0.5:
-                    score_str = f"[yellow]{score_val:.2f}[/]"
-                else:
-                    score_str = f"[red]{score_val:.2f}[/]"
+                score_str = f"[{score_style(score_val)}]{score_val:.2f}[/]"
                 status = f"[dim]penalty: -{mode_score.penalty_deduction:.2f}[/]" if mode_score.penalty_deduction else ""
             
             table.add_row(m_name.upper(), score_str, status)
     
-    console.print(table)
+    renderables.append(table)
     
     # Verbose: show component scores
     if verbose:
-        for m_name in modes_to_show:
-            mode_score = getattr(scores, f"{m_name}_score")
+        for m_name, mode_score in mode_scores.items():
             if mode_score and mode_score.component_scores:
-                console.print(f"\n[dim]{m_name.upper()} components:[/]")
+                renderables.append(f"\n[dim]{m_name.upper()} components:[/]")
                 for comp, data in mode_score.component_scores.items():
                     if "contribution" in data:
-                        console.print(f"  {comp}: {data['raw_value']} → {data['normalized']:.2f} × {data['weight']} = {data['contribution']:.3f}")
+                        renderables.append(f"  {comp}: {data['raw_value']} → {data['normalized']:.2f} × {data['weight']} = {data['contribution']:.3f}")
                     elif "deduction" in data:
-                        console.print(f"  {comp}: {data['raw_value']} → penalty {data['penalty']:.2f} × {data['weight']} = -{data['deduction']:.3f}")
+                        renderables.append(f"  {comp}: {data['raw_value']} → penalty {data['penalty']:.2f} × {data['weight']} = -{data['deduction']:.3f}")
+    
+    console.print(Group(*renderables))
 
 
 @cli.command()
@@ -567,16 +649,10 @@ def leaderboard(mode: str):
     """
     from scorer import score_all_brands, get_leaderboard
     
-    results = score_all_brands(DEFAULT_OUTPUT_DIR)
+    results = score_all_brands(DEFAULT_OUTPUT_DIR, modes=(mode,))
     rankings = get_leaderboard(results, mode)
     
-    console.print(f"\n[bold]🏆 Leaderboard: {mode.upper()} Mode[/]\n")
-    
-    table = Table(show_header=True)
-    table.add_column("Rank", justify="right", style="cyan")
-    table.add_column("Brand")
-    table.add_column("Score", justify="right")
-    table.add_column("Status")
+    table = new_table(LEADERBOARD_COLUMNS, show_header=True)
     
     for i, (brand, score_val, rejected) in enumerate(rankings, 1):
         if rejected:
@@ -585,25 +661,12 @@ def leaderboard(mode: str):
             status = "[dim]Hard reject[/]"
         else:
             rank = f"[bold]{i}[/]" if i <= 3 else str(i)
-            if score_val >= 0.7:
-                score_str = f"[green]{score_val:.3f}[/]"
-            elif score_val >= 0.5:
-                score_str = f"[yellow]{score_val:.3f}[/]"
-            else:
-                score_str = f"[red]{score_val:.3f}[/]"
-            
-            if i == 1:
-                status = "[green]🥇 Best[/]"
-            elif i == 2:
-                status = "[yellow]🥈[/]"
-            elif i == 3:
-                status = "[yellow]🥉[/]"
-            else:
-                status = ""
+            score_str = f"[{score_style(score_val)}]{score_val:.3f}[/]"
+            status = MEDAL_STATUSES.get(i, "")
         
         table.add_row(rank, brand, score_str, status)
     
-    console.print(table)
+    console.print(Group(f"\n[bold]🏆 Leaderboard: {mode.upper()} Mode[/]\n", table))
 
 
 # Entry point
@@ -5,16 +5,20 @@ Converts JSON output files to Supabase PostgreSQL database.
 Creates normalized tables: brands, nutrients, aminoacids, scores
 """
 
+import functools
+import hashlib
+import inspect
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import create_client, Client, PostgrestAPIError
 
-from scorer import Scorer
+from scorer import SCORING_SPEC_PATH, BrandScores, Scorer, _get_scorer, load_and_score_files
 
 
 # Load environment variables
@@ -23,8 +27,9 @@ load_dotenv()
 OUTPUT_DIR = Path("output")
 
 # Supabase client setup
+@functools.lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Create and return Supabase client."""
+    """Create the Supabase client once and reuse it (and its connections)."""
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_SECRET_KEY")  # Use secret key for write access
     
@@ -40,123 +45,207 @@ def get_supabase_client() -> Client:
 def load_brand_json(brand_name: str) -> Optional[dict]:
     """Load brand JSON file."""
     json_path = OUTPUT_DIR / brand_name / f"{brand_name}.json"
-    if not json_path.exists():
+    try:
+        return json.loads(json_path.read_bytes())
+    except FileNotFoundError:
         return None
-    with open(json_path) as f:
-        return json.load(f)
 
 
-def insert_brand(supabase: Client, data: dict) -> int:
-    """Insert brand data and return brand_id."""
-    brand_name = data.get("brand")
+# brands table columns copied as-is from product_info
+BRAND_PRODUCT_COLUMNS = (
+    "weight_kg", "price_inr", "price_per_kg", "servings_per_pack", "price_per_serving",
+)
+
+
+def brand_row(data: dict) -> dict:
+    """Build the brands row for a brand."""
     product_info = data.get("product_info", {}) or {}
     
-    # Upsert brand (insert or update if exists)
-    brand_data = {
-        "name": brand_name,
-        "weight_kg": product_info.get("weight_kg"),
-        "price_inr": product_info.get("price_inr"),
-        "price_per_kg": product_info.get("price_per_kg"),
-        "servings_per_pack": product_info.get("servings_per_pack"),
-        "price_per_serving": product_info.get("price_per_serving"),
-        "extraction_timestamp": data.get("extraction_timestamp"),
-    }
+    row = {"name": data.get("brand")}
+    row.update((column, product_info.get(column)) for column in BRAND_PRODUCT_COLUMNS)
+    row["extraction_timestamp"] = data.get("extraction_timestamp")
+    return row
+
+
+def brand_content_hash(data: dict) -> str:
+    """Fingerprint a brand's JSON together with the scoring spec and code.
     
-    # Try to get existing brand
-    existing = supabase.table("brands").select("id").eq("name", brand_name).execute()
+    The spec and scorer.py are included because scores are derived from
+    them, so changing either must invalidate every brand even when its
+    JSON is unchanged.
+    """
+    digest = _scoring_spec_digest().copy()
+    digest.update(json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _scoring_spec_digest() -> "hashlib.blake2b":
+    """Hash of the scoring spec and scorer source, the seed for every brand_content_hash."""
+    digest = hashlib.blake2b(SCORING_SPEC_PATH.read_bytes(), digest_size=16)
+    digest.update(Path(inspect.getfile(Scorer)).read_bytes())
+    return digest
+
+
+def fetch_content_hashes(supabase: Client) -> Optional[dict[str, str]]:
+    """Fetch the stored content_hash of every brand.
     
-    if existing.data:
-        # Update existing
-        brand_id = existing.data[0]["id"]
-        supabase.table("brands").update(brand_data).eq("id", brand_id).execute()
-    else:
-        # Insert new
-        result = supabase.table("brands").insert(brand_data).execute()
-        brand_id = result.data[0]["id"]
+    Returns:
+        Mapping of brand name to content_hash, or None if the brands table
+        has no content_hash column yet
+    """
+    try:
+        result = supabase.table("brands").select("name, content_hash").execute()
+    except PostgrestAPIError as e:
+        # 42703: undefined column, supabase/add_content_hash.sql has not been run yet
+        if e.code != "42703":
+            raise
+        supabase.table("brands").select("id").limit(1).execute()
+        return None
+    return {row["name"]: row["content_hash"] for row in result.data}
+
+
+def upsert_brands(
+    supabase: Client,
+    brands: list[dict],
+    content_hashes: Optional[dict[str, str]] = None,
+) -> dict[str, int]:
+    """Insert or update brands by name in a single request.
     
-    return brand_id
+    Args:
+        supabase: Supabase client
+        brands: Brand JSON dicts
+        content_hashes: Optional brand name to content_hash to store with each row
+    
+    Returns:
+        Mapping of brand name to brand_id
+    """
+    if not brands:
+        return {}
+    rows = [brand_row(data) for data in brands]
+    if content_hashes is not None:
+        for row in rows:
+            row["content_hash"] = content_hashes[row["name"]]
+    result = supabase.table("brands").upsert(rows, on_conflict="name").execute()
+    return {row["name"]: row["id"] for row in result.data}
 
 
-def insert_nutrients(supabase: Client, brand_id: int, data: dict):
-    """Insert nutrients data."""
+def store_content_hashes(supabase: Client, content_hashes: dict[str, str]):
+    """Record the content_hash of brands whose rows are fully written, in one request."""
+    if not content_hashes:
+        return
+    rows = [{"name": name, "content_hash": digest} for name, digest in content_hashes.items()]
+    supabase.table("brands").upsert(rows, on_conflict="name").execute()
+
+
+def insert_brand(supabase: Client, data: dict) -> int:
+    """Insert brand data and return brand_id."""
+    return upsert_brands(supabase, [data])[data.get("brand")]
+
+
+def replace_rows(supabase: Client, table: str, rows: list[dict]):
+    """Replace the rows of a per-brand table in one delete and one insert.
+    
+    Existing rows are removed only for the brands present in ``rows``.
+    """
+    if not rows:
+        return
+    brand_ids = [row["brand_id"] for row in rows]
+    supabase.table(table).delete().in_("brand_id", brand_ids).execute()
+    supabase.table(table).insert(rows).execute()
+
+
+# nutrients table column -> nutrition extracted_fields key
+NUTRIENT_COLUMNS = (
+    ("serving_size_g", "serving_size_g"),
+    ("energy_kcal", "energy_kcal_per_serving"),
+    ("protein_g", "protein_g_per_serving"),
+    ("carbohydrates_g", "carbohydrates_g_per_serving"),
+    ("total_fat_g", "total_fat_g_per_serving"),
+    ("sodium_mg", "sodium_mg_per_serving"),
+    ("added_sugar_g", "added_sugar_g_per_serving"),
+    ("heavy_metals_tested", "heavy_metals_tested"),
+)
+
+
+def nutrients_row(brand_id: Optional[int], data: dict) -> Optional[dict]:
+    """Build the nutrients row for a brand, or None if not extracted."""
     nutrients = data.get("nutrients", {})
     if not nutrients:
-        return
+        return None
     
     fields = nutrients.get("extracted_fields", {})
     quality = nutrients.get("quality", {})
     
-    nutrients_data = {
-        "brand_id": brand_id,
-        "serving_size_g": fields.get("serving_size_g"),
-        "energy_kcal": fields.get("energy_kcal_per_serving"),
-        "protein_g": fields.get("protein_g_per_serving"),
-        "carbohydrates_g": fields.get("carbohydrates_g_per_serving"),
-        "total_fat_g": fields.get("total_fat_g_per_serving"),
-        "sodium_mg": fields.get("sodium_mg_per_serving"),
-        "added_sugar_g": fields.get("added_sugar_g_per_serving"),       # NEW
-        "heavy_metals_tested": fields.get("heavy_metals_tested"),       # NEW
-        "extraction_confidence": quality.get("extraction_confidence"),
-    }
-    
-    # Delete existing and insert new
-    supabase.table("nutrients").delete().eq("brand_id", brand_id).execute()
-    supabase.table("nutrients").insert(nutrients_data).execute()
+    row = {"brand_id": brand_id}
+    row.update((column, fields.get(key)) for column, key in NUTRIENT_COLUMNS)
+    row["extraction_confidence"] = quality.get("extraction_confidence")
+    return row
 
 
-def insert_aminoacids(supabase: Client, brand_id: int, data: dict):
-    """Insert amino acids data."""
+def insert_nutrients(supabase: Client, brand_id: int, data: dict):
+    """Insert nutrients data."""
+    row = nutrients_row(brand_id, data)
+    if row:
+        replace_rows(supabase, "nutrients", [row])
+
+
+# aminoacids table columns by extracted_fields group; each group's
+# total_g is stored as <group>_total_g
+AMINO_GROUP_COLUMNS = (
+    (("eaas",), ("total_g", "lysine_g", "methionine_g", "phenylalanine_g",
+                 "threonine_g", "tryptophan_g", "histidine_g")),
+    (("eaas", "bcaas"), ("total_g", "leucine_g", "isoleucine_g", "valine_g")),
+    (("seaas",), ("total_g", "arginine_g", "cysteine_g", "glycine_g", "proline_g", "tyrosine_g")),
+    (("neaas",), ("total_g", "serine_g", "alanine_g", "aspartic_acid_g", "glutamic_acid_g")),
+)
+
+
+def aminoacids_row(brand_id: Optional[int], data: dict) -> Optional[dict]:
+    """Build the amino acids row for a brand, or None if not extracted."""
     amino = data.get("aminoacids", {})
     if not amino:
-        return
+        return None
     
     fields = amino.get("extracted_fields", {})
     quality = amino.get("quality", {})
     
-    eaas = fields.get("eaas", {})
-    bcaas = eaas.get("bcaas", {})
-    seaas = fields.get("seaas", {})
-    neaas = fields.get("neaas", {})
-    
-    amino_data = {
-        "brand_id": brand_id,
-        "serving_basis": fields.get("serving_basis"),
-        "eaas_total_g": eaas.get("total_g"),
-        "bcaas_total_g": bcaas.get("total_g"),
-        "leucine_g": bcaas.get("leucine_g"),
-        "isoleucine_g": bcaas.get("isoleucine_g"),
-        "valine_g": bcaas.get("valine_g"),
-        "lysine_g": eaas.get("lysine_g"),
-        "methionine_g": eaas.get("methionine_g"),
-        "phenylalanine_g": eaas.get("phenylalanine_g"),
-        "threonine_g": eaas.get("threonine_g"),
-        "tryptophan_g": eaas.get("tryptophan_g"),
-        "histidine_g": eaas.get("histidine_g"),
-        "seaas_total_g": seaas.get("total_g"),
-        "arginine_g": seaas.get("arginine_g"),
-        "cysteine_g": seaas.get("cysteine_g"),
-        "glycine_g": seaas.get("glycine_g"),
-        "proline_g": seaas.get("proline_g"),
-        "tyrosine_g": seaas.get("tyrosine_g"),
-        "neaas_total_g": neaas.get("total_g"),
-        "serine_g": neaas.get("serine_g"),
-        "alanine_g": neaas.get("alanine_g"),
-        "aspartic_acid_g": neaas.get("aspartic_acid_g"),
-        "glutamic_acid_g": neaas.get("glutamic_acid_g"),
-        "extraction_confidence": quality.get("extraction_confidence"),
-    }
-    
-    # Delete existing and insert new
-    supabase.table("aminoacids").delete().eq("brand_id", brand_id).execute()
-    supabase.table("aminoacids").insert(amino_data).execute()
+    row = {"brand_id": brand_id, "serving_basis": fields.get("serving_basis")}
+    for path, names in AMINO_GROUP_COLUMNS:
+        group = fields
+        for key in path:
+            group = group.get(key, {})
+        row.update(
+            (f"{path[-1]}_total_g" if name == "total_g" else name, group.get(name))
+            for name in names
+        )
+    row["extraction_confidence"] = quality.get("extraction_confidence")
+    return row
 
 
-def insert_scores(supabase: Client, brand_id: int, scores):
-    """Insert computed scores."""
+def insert_aminoacids(supabase: Client, brand_id: int, data: dict):
+    """Insert amino acids data."""
+    row = aminoacids_row(brand_id, data)
+    if row:
+        replace_rows(supabase, "aminoacids", [row])
+
+
+def _score_tuple(mode_score) -> tuple:
+    """Return (total_score, hard_rejected, rejection_reason) for a mode score."""
+    if mode_score is None:
+        return (None, False, None)
+    return (mode_score.total_score, mode_score.hard_rejected, mode_score.rejection_reason)
+
+
+def scores_row(brand_id: Optional[int], scores) -> dict:
+    """Build the scores row for a brand."""
     m = scores.metrics
     spiking = scores.amino_spiking
+    cut = _score_tuple(scores.cut_score)
+    bulk = _score_tuple(scores.bulk_score)
+    clean = _score_tuple(scores.clean_score)
     
-    scores_data = {
+    return {
         "brand_id": brand_id,
         "protein_pct": m.protein_pct,
         "protein_per_100_kcal": m.protein_per_100_kcal,
@@ -166,20 +255,21 @@ def insert_scores(supabase: Client, brand_id: int, scores):
         "leucine_g_per_serving": m.leucine_g_per_serving,
         "amino_spiking_suspected": spiking.suspected,
         "spiking_rules_triggered": ",".join(spiking.triggered_rules) if spiking.triggered_rules else None,
-        "cut_score": scores.cut_score.total_score if scores.cut_score else None,
-        "cut_rejected": scores.cut_score.hard_rejected if scores.cut_score else False,
-        "cut_rejection_reason": scores.cut_score.rejection_reason if scores.cut_score else None,
-        "bulk_score": scores.bulk_score.total_score if scores.bulk_score else None,
-        "bulk_rejected": scores.bulk_score.hard_rejected if scores.bulk_score else False,
-        "bulk_rejection_reason": scores.bulk_score.rejection_reason if scores.bulk_score else None,
-        "clean_score": scores.clean_score.total_score if scores.clean_score else None,
-        "clean_rejected": scores.clean_score.hard_rejected if scores.clean_score else False,
-        "clean_rejection_reason": scores.clean_score.rejection_reason if scores.clean_score else None,
+        "cut_score": cut[0],
+        "cut_rejected": cut[1],
+        "cut_rejection_reason": cut[2],
+        "bulk_score": bulk[0],
+        "bulk_rejected": bulk[1],
+        "bulk_rejection_reason": bulk[2],
+        "clean_score": clean[0],
+        "clean_rejected": clean[1],
+        "clean_rejection_reason": clean[2],
     }
-    
-    # Delete existing and insert new
-    supabase.table("scores").delete().eq("brand_id", brand_id).execute()
-    supabase.table("scores").insert(scores_data).execute()
+
+
+def insert_scores(supabase: Client, brand_id: int, scores):
+    """Insert computed scores."""
+    replace_rows(supabase, "scores", [scores_row(brand_id, scores)])
 
 
 def brand_exists(supabase: Client, brand_name: str) -> Optional[int]:
@@ -235,77 +325,174 @@ def push_brand(brand_name: str, force: bool = False) -> tuple[bool, str]:
         return False, f"No JSON data found for '{brand_name}' in output directory."
     
     # Compute scores
-    scorer = Scorer()
-    scores = scorer.score_brand(data)
+    scorer = _get_scorer()
+    scores = scorer.score_brand(data, detailed=False)
     
-    # Insert brand
-    brand_id = insert_brand(supabase, data)
-    
-    # Insert nutrients
-    insert_nutrients(supabase, brand_id, data)
+    # Write the brand and all child rows in one round trip. The function
+    # assigns brand_id itself, so the child rows are built without one.
+    # Storing the content hash lets the next build_database skip this brand
+    content_hash = brand_content_hash(data)
+    explanations = data.get("explanations")
+    payload = {
+        "brand": {**brand_row(data), "content_hash": content_hash},
+        "nutrients": nutrients_row(None, data),
+        "aminoacids": aminoacids_row(None, data),
+        "scores": scores_row(None, scores),
+        "explanations": explanations or None,
+    }
+    try:
+        supabase.rpc("upsert_brand_payload", {"payload": payload}).execute()
+    except PostgrestAPIError as e:
+        # PGRST202: supabase/upsert_brand_payload.sql has not been run yet
+        if e.code != "PGRST202":
+            raise
+        
+        # Insert brand, clearing its hash until the child rows are written.
+        # PGRST204: brands has no content_hash column yet (add_content_hash.sql)
+        try:
+            brand_id = upsert_brands(supabase, [data], {data.get("brand"): None})[data.get("brand")]
+        except PostgrestAPIError as e:
+            if e.code != "PGRST204":
+                raise
+            content_hash = None
+            brand_id = insert_brand(supabase, data)
+        
+        # Insert nutrients
+        insert_nutrients(supabase, brand_id, data)
+        
+        # Insert amino acids
+        insert_aminoacids(supabase, brand_id, data)
+        
+        # Insert scores
+        insert_scores(supabase, brand_id, scores)
+        
+        # Insert explanations if present in data
+        if explanations:
+            insert_explanations(supabase, brand_id, explanations)
+        
+        if content_hash:
+            store_content_hashes(supabase, {data.get("brand"): content_hash})
     
-    # Insert amino acids
-    insert_aminoacids(supabase, brand_id, data)
+    return True, f"Successfully pushed '{brand_name}' to Supabase."
+
+
+def load_and_score_brands(output_dir: Path = OUTPUT_DIR) -> list[tuple[str, dict, BrandScores]]:
+    """Load and score every brand with a JSON file under output_dir.
     
-    # Insert scores
-    insert_scores(supabase, brand_id, scores)
+    Returns:
+        List of (brand_name, data, scores) in directory order
+    """
+    # scandir's entries carry the d_type, so is_dir() needs no extra stat
+    with os.scandir(output_dir) as entries:
+        brand_names = [
+            entry.name
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+    
+    # Large directories are scored across processes; only the writes stay
+    # in the caller. Missing and empty brand files are skipped
+    json_paths = [Path(output_dir) / brand_name / f"{brand_name}.json" for brand_name in brand_names]
+    results = load_and_score_files(json_paths)
+    return [
+        (brand_name, *result)
+        for brand_name, result in zip(brand_names, results)
+        if result and result[0]
+    ]
+
+
+def child_rows(loaded: list[tuple[str, dict, BrandScores]], brand_ids: dict[str, int]) -> dict[str, list[dict]]:
+    """Build the nutrients, aminoacids and scores rows for loaded brands.
     
-    # Insert explanations if present in data
-    explanations = data.get("explanations")
-    if explanations:
-        insert_explanations(supabase, brand_id, explanations)
+    Args:
+        loaded: (brand_name, data, scores) tuples from load_and_score_brands
+        brand_ids: Mapping of brand name to brand_id
     
-    return True, f"Successfully pushed '{brand_name}' to Supabase."
+    Returns:
+        Mapping of table name to its rows
+    """
+    rows = {"nutrients": [], "aminoacids": [], "scores": []}
+    for _, data, scores in loaded:
+        brand_id = brand_ids[data.get("brand")]
+        
+        row = nutrients_row(brand_id, data)
+        if row:
+            rows["nutrients"].append(row)
+        row = aminoacids_row(brand_id, data)
+        if row:
+            rows["aminoacids"].append(row)
+        rows["scores"].append(scores_row(brand_id, scores))
+    return rows
 
 
-def build_database(output_dir: Path = OUTPUT_DIR):
-    """Build Supabase database from JSON output files."""
+def build_database(output_dir: Path = OUTPUT_DIR, force: bool = False):
+    """Build Supabase database from JSON output files.
+    
+    Args:
+        output_dir: Directory holding one subdirectory per brand
+        force: If True, rewrite every brand even when its content hash is unchanged
+    """
     print("Connecting to Supabase...")
     supabase = get_supabase_client()
     
-    # Verify connection by checking if brands table exists
+    # Verify connection and fetch the stored content hashes in one request
     try:
-        supabase.table("brands").select("id").limit(1).execute()
+        stored_hashes = fetch_content_hashes(supabase)
         print("✓ Connected to Supabase\n")
     except Exception as e:
         print(f"✗ Failed to connect: {e}")
         print("\nMake sure you have:")
         print("  1. Run supabase/schema.sql in your Supabase SQL Editor")
+        print("     (existing databases: run supabase/add_content_hash.sql)")
         print("  2. Set SUPABASE_URL and SUPABASE_SECRET_KEY in .env")
         return
-    
-    # Score all brands
-    scorer = Scorer()
-    
-    # Process each brand
-    brands_processed = 0
-    for brand_dir in output_dir.iterdir():
-        if not brand_dir.is_dir() or brand_dir.name.startswith("."):
-            continue
-        
-        brand_name = brand_dir.name
-        data = load_brand_json(brand_name)
-        if not data:
-            continue
-        
-        # Insert brand
-        brand_id = insert_brand(supabase, data)
-        
-        # Insert nutrients
-        insert_nutrients(supabase, brand_id, data)
-        
-        # Insert amino acids
-        insert_aminoacids(supabase, brand_id, data)
-        
-        # Compute and insert scores
-        scores = scorer.score_brand(data)
-        insert_scores(supabase, brand_id, scores)
-        
-        brands_processed += 1
-        print(f"  ✓ {brand_name}")
+    if stored_hashes is None:
+        print("! brands.content_hash is missing, rewriting every brand")
+        print("  (run supabase/add_content_hash.sql to skip unchanged brands)\n")
+    
+    loaded = load_and_score_brands(output_dir)
+    
+    # Only brands whose JSON (or the scoring spec or code) changed need writing
+    content_hashes = None
+    changed = loaded
+    if stored_hashes is not None:
+        content_hashes = {data.get("brand"): brand_content_hash(data) for _, data, _ in loaded}
+        if not force:
+            changed = [
+                entry for entry in loaded
+                if stored_hashes.get(entry[1].get("brand")) != content_hashes[entry[1].get("brand")]
+            ]
+    
+    # Upsert all changed brands at once to get their ids. Their hashes are
+    # cleared here and stored only after every child table is written, so a
+    # run that fails partway is redone by the next one instead of skipped
+    changed_names = [data.get("brand") for _, data, _ in changed]
+    cleared_hashes = None if content_hashes is None else dict.fromkeys(changed_names)
+    brand_ids = upsert_brands(supabase, [data for _, data, _ in changed], cleared_hashes)
+    
+    # Write child tables, one delete and one insert per table. The tables are
+    # independent, so their round trips overlap on a shared client
+    tables = child_rows(changed, brand_ids)
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        futures = [
+            executor.submit(replace_rows, supabase, table, rows)
+            for table, rows in tables.items()
+        ]
+    for future in futures:
+        future.result()
+    
+    if content_hashes is not None:
+        store_content_hashes(supabase, {name: content_hashes[name] for name in changed_names})
+    
+    changed_dirs = {brand_name for brand_name, _, _ in changed}
+    for brand_name, _, _ in loaded:
+        if brand_name in changed_dirs:
+            print(f"  ✓ {brand_name}")
+        else:
+            print(f"  = {brand_name} (unchanged)")
     
     print(f"\n✓ Database updated in Supabase")
-    print(f"  Brands: {brands_processed}")
+    print(f"  Brands: {len(loaded)} ({len(changed)} updated)")
 
 
 def verify_database():
@@ -313,21 +500,22 @@ def verify_database():
     print("Verifying Supabase database...\n")
     supabase = get_supabase_client()
     
-    # Check counts
-    brands = supabase.table("brands").select("id", count="exact").execute()
-    nutrients = supabase.table("nutrients").select("id", count="exact").execute()
-    aminoacids = supabase.table("aminoacids").select("id", count="exact").execute()
-    scores = supabase.table("scores").select("id", count="exact").execute()
+    # Check counts with HEAD requests (count only, no rows), issued together
+    # with the leaderboard preview since none depends on another
+    tables = {"Brands": "brands", "Nutrients": "nutrients", "Amino acids": "aminoacids", "Scores": "scores"}
+    with ThreadPoolExecutor(max_workers=len(tables) + 1) as executor:
+        counts = {
+            label: executor.submit(supabase.table(table).select("id", count="exact", head=True).execute)
+            for label, table in tables.items()
+        }
+        leaderboard = executor.submit(supabase.table("leaderboard").select("*").limit(5).execute)
     
-    print(f"  Brands: {brands.count}")
-    print(f"  Nutrients: {nutrients.count}")
-    print(f"  Amino acids: {aminoacids.count}")
-    print(f"  Scores: {scores.count}")
+    for label, count in counts.items():
+        print(f"  {label}: {count.result().count}")
     
     # Show leaderboard preview
     print("\nLeaderboard (top 5 by cut score):")
-    leaderboard = supabase.table("leaderboard").select("*").limit(5).execute()
-    for row in leaderboard.data:
+    for row in leaderboard.result().data:
         name = row.get("brand", "Unknown")
         cut_score = row.get("cut_score")
         cut_score_str = f"{cut_score:.2f}" if cut_score else "N/A"
@@ -341,4 +529,4 @@ if __name__ == "__main__":
         verify_database()
     else:
         print("Building database from JSON output...\n")
-        build_database()
+        build_database(force="--force" in sys.argv[1:])
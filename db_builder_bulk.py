@@ -0,0 +1,125 @@
+"""
+Bulk Loader for Protein Analyser - Direct Postgres Edition
+
+Streams every brand into the Supabase Postgres database with COPY over a
+direct psycopg connection, instead of one PostgREST request per table.
+Meant for first-time population and full rebuilds; push_brand keeps using
+the Supabase client.
+
+Requires psycopg (pip install -e .[bulk]) and SUPABASE_DB_URL in .env.
+"""
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from db_builder import OUTPUT_DIR, brand_content_hash, brand_row, child_rows, load_and_score_brands
+
+if TYPE_CHECKING:
+    from psycopg import Cursor
+
+
+def get_db_url() -> str:
+    """Return the direct Postgres connection string for Supabase."""
+    url = os.getenv("SUPABASE_DB_URL")
+    if not url:
+        raise ValueError(
+            "Missing SUPABASE_DB_URL environment variable.\n"
+            "Copy the connection string from Supabase → Project Settings → Database."
+        )
+    return url
+
+
+def copy_rows(cur: "Cursor", table: str, rows: list[dict]):
+    """Stream rows into a table with COPY FROM STDIN."""
+    from psycopg import sql
+    
+    columns = list(rows[0])
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
+    with cur.copy(statement) as copy:
+        for row in rows:
+            copy.write_row([row[column] for column in columns])
+
+
+def upsert_brands_from_staging(cur: "Cursor", brand_rows: list[dict]) -> dict[str, int]:
+    """COPY brands into a staging table and merge them into brands by name.
+    
+    Returns:
+        Mapping of brand name to brand_id
+    """
+    from psycopg import sql
+    
+    columns = sql.SQL(", ").join(map(sql.Identifier, brand_rows[0]))
+    updates = sql.SQL(", ").join(
+        sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(column))
+        for column in brand_rows[0]
+        if column != "name"
+    )
+    
+    cur.execute(sql.SQL(
+        "CREATE TEMP TABLE brands_staging ON COMMIT DROP AS "
+        "SELECT {} FROM brands WITH NO DATA"
+    ).format(columns))
+    copy_rows(cur, "brands_staging", brand_rows)
+    cur.execute(sql.SQL(
+        "INSERT INTO brands ({0}) SELECT {0} FROM brands_staging "
+        "ON CONFLICT (name) DO UPDATE SET {1} RETURNING id, name"
+    ).format(columns, updates))
+    return {name: brand_id for brand_id, name in cur.fetchall()}
+
+
+def bulk_load(output_dir: Path = OUTPUT_DIR):
+    """Load all brands into Postgres in a single COPY-based transaction."""
+    try:
+        import psycopg
+        from psycopg import sql
+    except ImportError:
+        print("✗ psycopg is not installed. Run: pip install -e .[bulk]")
+        return
+    
+    loaded = load_and_score_brands(output_dir)
+    if not loaded:
+        print("No brand JSON files found.")
+        return
+    
+    print("Connecting to Postgres...")
+    with psycopg.connect(get_db_url()) as conn, conn.cursor() as cur:
+        # One transaction for the whole run: a single commit, and a failed
+        # load leaves the previous data in place
+        with conn.transaction():
+            # Store content hashes so a later build_database skips these brands
+            brand_ids = upsert_brands_from_staging(cur, [
+                {**brand_row(data), "content_hash": brand_content_hash(data)}
+                for _, data, _ in loaded
+            ])
+            tables = {
+                table: rows
+                for table, rows in child_rows(loaded, brand_ids).items()
+                if rows
+            }
+            
+            # Clear old child rows, pipelining the deletes into one round trip
+            with conn.pipeline():
+                for table, rows in tables.items():
+                    cur.execute(
+                        sql.SQL("DELETE FROM {} WHERE brand_id = ANY(%s)").format(sql.Identifier(table)),
+                        ([row["brand_id"] for row in rows],),
+                    )
+            
+            # COPY cannot run inside a pipeline, so stream each table in turn
+            for table, rows in tables.items():
+                copy_rows(cur, table, rows)
+    
+    for brand_name, _, _ in loaded:
+        print(f"  ✓ {brand_name}")
+    
+    print("\n✓ Bulk load complete")
+    print(f"  Brands: {len(loaded)}")
+
+
+if __name__ == "__main__":
+    print("Bulk loading database from JSON output...\n")
+    bulk_load()
@@ -4,6 +4,7 @@ Extractors Package
 Provides modular extractors for different label types.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Literal, Optional
@@ -36,6 +37,7 @@ class BrandExtractionResult(BaseModel):
     product_info: Optional[ProductInfo] = None
     nutrients: Optional[dict] = None
     aminoacids: Optional[dict] = None
+    explanations: Optional[dict] = None
 
 
 # Extractor registry
@@ -61,10 +63,10 @@ def get_extractor(
     Returns:
         Configured extractor instance
     """
-    if profile_type not in EXTRACTORS:
+    extractor_class = EXTRACTORS.get(profile_type)
+    if extractor_class is None:
         raise ValueError(f"Unknown profile type: {profile_type}. Available: {list(EXTRACTORS.keys())}")
     
-    extractor_class = EXTRACTORS[profile_type]
     return extractor_class(provider=provider, model=model)
 
 
@@ -74,6 +76,7 @@ def extract_brand(
     model: Optional[str] = None,
     extract_nutrients: bool = True,
     extract_aminoacids: bool = True,
+    extraction_timestamp: Optional[str] = None,
 ) -> BrandExtractionResult:
     """
     Extract all requested profiles for a brand.
@@ -84,6 +87,8 @@ def extract_brand(
         model: Optional model override
         extract_nutrients: Whether to extract nutrition profile
         extract_aminoacids: Whether to extract amino acid profile
+        extraction_timestamp: Optional ISO timestamp to record; batch callers
+            can pass one shared value. Defaults to the current time.
     
     Returns:
         BrandExtractionResult with requested extractions
@@ -95,24 +100,37 @@ def extract_brand(
     brand_name = brand_dir.name
     result = BrandExtractionResult(
         brand=brand_name,
-        extraction_timestamp=datetime.now().isoformat(),
+        extraction_timestamp=extraction_timestamp or datetime.now().isoformat(),
     )
     
-    # Extract nutrients if requested
+    # Collect (result field, extractor, image, product_id) for requested profiles
+    jobs = []
     if extract_nutrients:
         nutrients_img = NutritionExtractor.find_image(brand_dir)
         if nutrients_img:
             extractor = NutritionExtractor(provider=provider, model=model)
-            extraction = extractor.extract(nutrients_img, f"{brand_name}_nutrients")
-            result.nutrients = extraction.model_dump()
+            extractor.warm()
+            jobs.append(("nutrients", extractor, nutrients_img, f"{brand_name}_nutrients"))
     
-    # Extract amino acids if requested
     if extract_aminoacids:
         amino_img = AminoacidExtractor.find_image(brand_dir)
         if amino_img:
             extractor = AminoacidExtractor(provider=provider, model=model)
-            extraction = extractor.extract(amino_img, f"{brand_name}_aminoacid")
-            result.aminoacids = extraction.model_dump()
+            extractor.warm()
+            jobs.append(("aminoacids", extractor, amino_img, f"{brand_name}_aminoacid"))
+    
+    if not jobs:
+        return result
+    
+    # Extractions are independent network-bound LLM calls, so overlap them
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            field: executor.submit(extractor.extract, image, product_id)
+            for field, extractor, image, product_id in jobs
+        }
+    
+    for field, future in futures.items():
+        setattr(result, field, future.result().model_dump())
     
     return result
 
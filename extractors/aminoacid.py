@@ -45,24 +45,19 @@ class AminoacidExtractor(BaseExtractor):
         "amino*.*",
     ]
     
-    @classmethod
-    def find_image(cls, brand_dir: Path) -> Optional[Path]:
-        """Find amino acid profile image in a brand directory."""
-        for pattern in cls.FILE_PATTERNS:
-            matches = list(brand_dir.glob(pattern))
-            for match in matches:
-                if match.suffix.lower() in [".png", ".jpg", ".jpeg", ".webp"]:
-                    return match
-        return None
-    
-    def extract(self, image_path: str | Path, product_id: str) -> ExtractionResult:
+    def extract(
+        self,
+        image_path: str | Path,
+        product_id: str,
+        collect_errors: bool = True,
+    ) -> ExtractionResult:
         """
         Extract amino acid profile and compute category totals.
         
         Overrides base extract to add computation of totals from individual values.
         """
         # Get base extraction result
-        result = super().extract(image_path, product_id)
+        result = super().extract(image_path, product_id, collect_errors)
         
         # Compute totals from individual values
         result = self._compute_totals(result)
@@ -145,12 +140,12 @@ class AminoacidExtractor(BaseExtractor):
         
         Returns None if any required value is missing.
         """
-        values = []
+        total = 0
         for key in keys:
             value = category.get(key)
             if value is None:
                 # Can't compute if any value is missing
                 return None
-            values.append(value)
+            total += value
         
-        return sum(values)
+        return total
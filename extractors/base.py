@@ -4,23 +4,187 @@ Base Extractor Module
 Contains shared LLM client initialization and API calling logic.
 """
 
-import base64
+import fnmatch
+import functools
+import io
 import json
 import os
+import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Optional
+from typing import TYPE_CHECKING, Iterable, Literal, Optional
 
 import jsonschema
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+from .ratelimit import RateLimiter, call_with_retry
+
+# SIMD-accelerated base64 when installed (pip install -e .[fast]); same API
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Rust validator for pass/fail checks when installed (pip install -e .[fast])
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+if TYPE_CHECKING:
+    import PIL.Image
+
 load_dotenv()
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 SKILLS_DIR = BASE_DIR / "skills"
 
+# Label image extensions accepted by find_image
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
+
+# Longest edge, in pixels, of images sent to the LLM (Gemini's tile size)
+MAX_IMAGE_EDGE = 1568
+
+# Filename keywords used by detect_profile_type
+PROFILE_KEYWORD_RE = re.compile(r"nutrient|nutrition|amino", re.IGNORECASE)
+
+# Default extract_many request rates (free-tier Gemini, tier-1 OpenAI)
+PROVIDER_MAX_RPM = {"gemini": 15, "openai": 500}
+
+# Optional ```/```json fences around an LLM response; group 1 is the payload
+MARKDOWN_FENCE_RE = re.compile(r"^(?:```(?:json)?)?(.*?)(?:```)?$", re.DOTALL)
+
+# Bytes read per base64 chunk; a multiple of 3 so no chunk needs padding
+BASE64_CHUNK_SIZE = 57 * 1024
+
+# Encoded images kept by encode_image. Each entry is a whole base64 image,
+# often several MB, and reuse only spans one brand's labels and the
+# retries of their requests, so a handful is enough
+ENCODED_IMAGE_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=None)
+def load_prompt(filename: str) -> str:
+    """Load a prompt file from the skills directory, once per process."""
+    prompt_path = SKILLS_DIR / filename
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    return prompt_path.read_text()
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(filename: str) -> dict:
+    """Load a JSON schema from the skills directory, once per process."""
+    schema_path = SKILLS_DIR / filename
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    return json.loads(schema_path.read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def load_validator(filename: str) -> jsonschema.protocols.Validator:
+    """Build a checked validator for a schema file, once per process.
+    
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    schema = load_schema(filename)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def load_fast_validator(filename: str) -> Optional["jsonschema_rs.Validator"]:
+    """Build a jsonschema-rs validator for a schema file, or None if not installed.
+    
+    Only decides pass/fail; error messages come from load_validator so they
+    match jsonschema's. Formats are not asserted, as in jsonschema.
+    """
+    if jsonschema_rs is None:
+        return None
+    return jsonschema_rs.validator_for(load_schema(filename), validate_formats=False)
+
+
+@functools.lru_cache(maxsize=ENCODED_IMAGE_CACHE_SIZE)
+def encode_image(image_path: str, mtime_ns: int, size: int) -> tuple[str, str]:
+    """Base64-encode an image and determine its MIME type.
+    
+    mtime_ns and size are part of the cache key only, so an image that
+    changes on disk is re-encoded.
+    
+    Returns:
+        (base64 data, MIME type)
+    """
+    suffix = Path(image_path).suffix.lower()
+    mime_types = {
+        ".png": "image/png",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".webp": "image/webp",
+        ".gif": "image/gif",
+    }
+    mime_type = mime_types.get(suffix, "image/png")
+    
+    image = load_label_image(image_path)
+    if image is None:
+        # Encode in 3-byte-aligned chunks so the raw file is never held whole
+        buffer = io.BytesIO()
+        with open(image_path, "rb") as f:
+            while chunk := f.read(BASE64_CHUNK_SIZE):
+                buffer.write(base64.b64encode(chunk))
+        return buffer.getvalue().decode("ascii"), mime_type
+    
+    # Downscaled images are re-encoded as JPEG, flattening any transparency onto white
+    import PIL.Image
+    
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        flattened = PIL.Image.new("RGB", image.size, "white")
+        flattened.paste(image, mask=image.getchannel("A"))
+        image = flattened
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=85, optimize=True)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8"), "image/jpeg"
+
+
+def load_label_image(image_path: str | Path) -> Optional["PIL.Image.Image"]:
+    """Open a label image downscaled to MAX_IMAGE_EDGE.
+    
+    Returns None when the image already fits or is not readable by Pillow,
+    in which case callers send the file as-is.
+    
+    Labels are text-dominant and the vision encoders resize internally, so
+    larger images only add upload size and input tokens.
+    """
+    import PIL.Image
+    
+    try:
+        image = PIL.Image.open(image_path)
+    except OSError:
+        return None
+    if max(image.size) <= MAX_IMAGE_EDGE:
+        image.close()
+        return None
+    image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), PIL.Image.LANCZOS)
+    return image
+
+
+@functools.lru_cache(maxsize=1024)
+def list_images(brand_dir: str, mtime_ns: int) -> tuple[str, ...]:
+    """List the label image file names in a brand directory.
+    
+    mtime_ns is part of the cache key only: adding, removing or renaming a
+    file updates the directory's mtime, so a changed directory is rescanned.
+    """
+    with os.scandir(brand_dir) as entries:
+        return tuple(entry.name for entry in entries if entry.name.lower().endswith(IMAGE_SUFFIXES))
+
 
 class ExtractionResult(BaseModel):
     """Result from label extraction."""
@@ -47,6 +211,7 @@ class BaseExtractor(ABC):
     PROFILE_TYPE: str = ""
     PROMPT_FILE: str = ""
     SCHEMA_FILE: str = ""
+    FILE_PATTERNS: list[str] = []
     
     def __init__(
         self,
@@ -89,38 +254,39 @@ class BaseExtractor(ABC):
     def prompt(self) -> str:
         """Load and cache prompt."""
         if self._prompt is None:
-            prompt_path = SKILLS_DIR / self.PROMPT_FILE
-            if not prompt_path.exists():
-                raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-            self._prompt = prompt_path.read_text()
+            self._prompt = load_prompt(self.PROMPT_FILE)
         return self._prompt
     
     @property
     def schema(self) -> dict:
         """Load and cache schema."""
         if self._schema is None:
-            schema_path = SKILLS_DIR / self.SCHEMA_FILE
-            if not schema_path.exists():
-                raise FileNotFoundError(f"Schema file not found: {schema_path}")
-            self._schema = json.loads(schema_path.read_text())
+            self._schema = load_schema(self.SCHEMA_FILE)
         return self._schema
     
+    @property
+    def validator(self) -> jsonschema.protocols.Validator:
+        """Checked validator for SCHEMA_FILE, shared by every instance.
+        
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid
+        """
+        return load_validator(self.SCHEMA_FILE)
+    
+    def warm(self) -> None:
+        """Load the prompt, schema and validators ahead of the first extraction."""
+        self.prompt
+        self.schema
+        try:
+            self.validator
+            load_fast_validator(self.SCHEMA_FILE)
+        except jsonschema.SchemaError:
+            pass  # Reported per extraction by validate_output
+    
     def _encode_image(self, image_path: Path) -> tuple[str, str]:
         """Encode image to base64 and determine MIME type."""
-        suffix = image_path.suffix.lower()
-        mime_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".webp": "image/webp",
-            ".gif": "image/gif",
-        }
-        mime_type = mime_types.get(suffix, "image/png")
-        
-        with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
-        
-        return image_data, mime_type
+        stat = image_path.stat()
+        return encode_image(str(image_path), stat.st_mtime_ns, stat.st_size)
     
     def _call_openai(self, image_path: Path, product_id: str) -> dict:
         """Call OpenAI API for extraction."""
@@ -161,7 +327,7 @@ class BaseExtractor(ABC):
         """Call Gemini API for extraction."""
         import PIL.Image
         
-        image = PIL.Image.open(image_path)
+        image = load_label_image(image_path) or PIL.Image.open(image_path)
         full_prompt = f"{self.prompt}\n\nExtract information from this label. Product ID: {product_id}"
         
         response = self._client.models.generate_content(
@@ -177,35 +343,50 @@ class BaseExtractor(ABC):
     
     def _parse_response(self, content: str) -> dict:
         """Parse LLM response, removing markdown if present."""
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        return json.loads(content.strip())
+        payload = MARKDOWN_FENCE_RE.match(content.strip()).group(1)
+        return json.loads(payload.strip())
     
-    def validate_output(self, output: dict) -> tuple[bool, list[str]]:
-        """Validate extraction output against schema."""
+    def validate_output(self, output: dict, collect_errors: bool = True) -> tuple[bool, list[str]]:
+        """Validate extraction output against schema.
+        
+        Validity is checked first, with jsonschema-rs when installed; the
+        error message is only built for invalid output, and not at all with
+        collect_errors=False.
+        """
         errors = []
         try:
-            jsonschema.validate(output, self.schema)
-            return True, []
-        except jsonschema.ValidationError as e:
-            errors.append(str(e.message))
-            return False, errors
+            validator = self.validator
         except jsonschema.SchemaError as e:
             errors.append(f"Schema error: {e.message}")
             return False, errors
+        
+        fast_validator = load_fast_validator(self.SCHEMA_FILE)
+        if (fast_validator or validator).is_valid(output):
+            return True, errors
+        if not collect_errors:
+            return False, errors
+        
+        # Same error jsonschema.validate would raise, without re-checking the schema
+        error = jsonschema.exceptions.best_match(validator.iter_errors(output))
+        if error is None:
+            return True, []
+        errors.append(str(error.message))
+        return False, errors
     
-    def extract(self, image_path: str | Path, product_id: str) -> ExtractionResult:
+    def extract(
+        self,
+        image_path: str | Path,
+        product_id: str,
+        collect_errors: bool = True,
+    ) -> ExtractionResult:
         """
         Extract information from a label image.
         
         Args:
             image_path: Path to the label image
             product_id: Identifier for the product
+            collect_errors: Whether to report validation error messages; when
+                False only the valid flag is computed
         
         Returns:
             ExtractionResult with extracted data and validation status
@@ -221,7 +402,7 @@ class BaseExtractor(ABC):
             output = self._call_gemini(image_path, product_id)
         
         # Validate output
-        valid, errors = self.validate_output(output)
+        valid, errors = self.validate_output(output, collect_errors)
         
         return ExtractionResult(
             product_id=output.get("product_id", product_id),
@@ -235,10 +416,54 @@ class BaseExtractor(ABC):
             validation_errors=errors,
         )
     
+    def extract_many(
+        self,
+        items: Iterable[tuple[str | Path, str]],
+        max_workers: int = 8,
+        max_rpm: Optional[int] = None,
+        collect_errors: bool = True,
+    ) -> list[ExtractionResult]:
+        """
+        Extract several label images concurrently.
+        
+        Requests share a rate limit and are retried with exponential backoff
+        on 429 responses.
+        
+        Args:
+            items: (image_path, product_id) pairs
+            max_workers: Maximum requests in flight
+            max_rpm: Requests per minute; defaults to PROVIDER_MAX_RPM for the provider
+            collect_errors: Passed to extract; False skips building error messages
+        
+        Returns:
+            ExtractionResults in the same order as items
+        """
+        limiter = RateLimiter(max_rpm or PROVIDER_MAX_RPM[self.provider])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    call_with_retry, limiter, self.extract, image_path, product_id, collect_errors
+                )
+                for image_path, product_id in items
+            ]
+            return [future.result() for future in futures]
+    
     @classmethod
     def find_image(cls, brand_dir: Path) -> Optional[Path]:
-        """Find the appropriate image file in a brand directory."""
-        # Subclasses should override this to define their file patterns
+        """Find the appropriate image file in a brand directory.
+        
+        Lists the directory once (cached until it changes), then tries
+        FILE_PATTERNS in priority order against the image file names.
+        """
+        try:
+            names = list_images(str(brand_dir), os.stat(brand_dir).st_mtime_ns)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        
+        for pattern in cls.FILE_PATTERNS:
+            for name in names:
+                if fnmatch.fnmatchcase(name, pattern):
+                    return brand_dir / name
         return None
 
 
@@ -248,11 +473,12 @@ def detect_profile_type(image_path: Path) -> Literal["nutrients", "aminoacid", "
     
     Uses explicit filename-based detection for reliability.
     """
-    name = image_path.stem.lower()
+    keywords = {keyword.lower() for keyword in PROFILE_KEYWORD_RE.findall(image_path.stem)}
     
-    if "nutrient" in name or "nutrition" in name:
+    # Nutrition keywords win over amino, wherever they appear in the name
+    if "nutrient" in keywords or "nutrition" in keywords:
         return "nutrients"
-    elif "amino" in name:
+    elif "amino" in keywords:
         return "aminoacid"
     else:
         return "unknown"
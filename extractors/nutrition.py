@@ -4,9 +4,6 @@ Nutrition Label Extractor
 Extracts nutritional information from protein powder nutrition labels.
 """
 
-from pathlib import Path
-from typing import Optional
-
 from .base import BaseExtractor
 
 
@@ -28,13 +25,3 @@ class NutritionExtractor(BaseExtractor):
         "nutritional_info.*",
         "nutrition.*",
     ]
-    
-    @classmethod
-    def find_image(cls, brand_dir: Path) -> Optional[Path]:
-        """Find nutrition label image in a brand directory."""
-        for pattern in cls.FILE_PATTERNS:
-            matches = list(brand_dir.glob(pattern))
-            for match in matches:
-                if match.suffix.lower() in [".png", ".jpg", ".jpeg", ".webp"]:
-                    return match
-        return None
@@ -0,0 +1,45 @@
+"""
+Rate Limiting Module
+
+Shared request pacing and 429 retry logic for concurrent LLM calls.
+"""
+
+import random
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly to stay under max_rpm."""
+    
+    def __init__(self, max_rpm: int):
+        self.interval = 60.0 / max_rpm
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def acquire(self):
+        """Block until the caller may make its next request."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an SDK exception is an HTTP 429 (quota or rate limit)."""
+    # google-genai and google.api_core errors carry .code, openai's carry .status_code
+    return 429 in (getattr(error, "code", None), getattr(error, "status_code", None))
+
+
+def call_with_retry(limiter: RateLimiter, fn, *args, max_attempts: int = 5):
+    """Call an LLM helper under the rate limit, backing off exponentially on 429s."""
+    for attempt in range(max_attempts):
+        limiter.acquire()
+        try:
+            return fn(*args)
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt == max_attempts - 1:
+                raise
+            time.sleep(2 ** attempt + random.random())
@@ -2,11 +2,21 @@
 Generate AI explanations for all brands and store in Supabase.
 
 Run this after populating the database with brands/nutrients/scores.
+Pass --batch to submit the work as a Gemini batch job instead.
 """
 
+import functools
+import hashlib
+import json
 import os
+import sqlite3
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional, TypeVar
 
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -19,6 +29,78 @@ genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 
 # Import Supabase client
 from db_builder import get_supabase_client
+from extractors.ratelimit import RateLimiter, call_with_retry
+
+T = TypeVar("T")
+
+
+EXPLANATION_MODEL = "gemini-2.0-flash"
+
+# Responses keyed by a hash of the rendered prompt, so reruns skip unchanged inputs
+EXPLANATION_CACHE_PATH = Path(__file__).parent / "output" / ".explanation_cache.db"
+_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def get_model() -> genai.GenerativeModel:
+    """Return the shared Gemini model used for every explanation."""
+    return genai.GenerativeModel(EXPLANATION_MODEL)
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache() -> sqlite3.Connection:
+    """Open the explanation response cache, shared by all worker threads."""
+    EXPLANATION_CACHE_PATH.parent.mkdir(exist_ok=True)
+    conn = sqlite3.connect(EXPLANATION_CACHE_PATH, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS explanation_cache ("
+        "key TEXT PRIMARY KEY, prompt TEXT, response TEXT, model TEXT, created_at TEXT)"
+    )
+    return conn
+
+
+def prompt_key(prompt: str) -> str:
+    """Cache key for a rendered prompt and the model answering it."""
+    return hashlib.sha256(f"{EXPLANATION_MODEL}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def cached_response(prompt: str) -> Optional[str]:
+    """Return the cached response for a prompt, or None."""
+    with _cache_lock:
+        row = get_cache().execute(
+            "SELECT response FROM explanation_cache WHERE key = ?", (prompt_key(prompt),)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def cache_response(prompt: str, response: str):
+    """Store a response for a prompt."""
+    with _cache_lock, get_cache() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO explanation_cache VALUES (?, ?, ?, ?, ?)",
+            (prompt_key(prompt), prompt, response, EXPLANATION_MODEL, datetime.now().isoformat()),
+        )
+
+
+def generate_text(prompt: str, parse: Optional[Callable[[str], T]] = None) -> T | str:
+    """Answer a prompt with Gemini, serving repeats from the response cache.
+    
+    Args:
+        prompt: Fully rendered prompt
+        parse: Optional parser for the stripped response; a response is
+            cached only once it parses
+    
+    Returns:
+        The stripped response, or parse(response) when parse is given
+    """
+    text = cached_response(prompt)
+    if text is None:
+        text = get_model().generate_content(prompt).text.strip()
+        result = parse(text) if parse else text
+        cache_response(prompt, text)
+        return result
+    return parse(text) if parse else text
 
 # Scoring context for the LLM
 SCORING_CONTEXT = """
@@ -50,6 +132,46 @@ KEY METRICS:
 - leucine: key amino acid for muscle protein synthesis (need 2.7g+ per serving)
 """
 
+# Single-brand explanation prompt; brand_block is one of the brand templates below
+EXPLANATION_PROMPT_TEMPLATE = SCORING_CONTEXT + """
+
+Now explain the {mode_upper} score for this protein powder brand:
+
+{brand_block}
+
+Provide a concise 2-3 sentence explanation of why this brand got this {mode} score. Focus on the key factors that influenced the score. Be specific about what's good or bad about this product for someone in {mode} mode. Use plain language."""
+
+# Brand fields for an explanation prompt, filled from extraction data and
+# BrandScores (generate_explanation_from_data) or from a leaderboard row
+# (format_leaderboard_brand). Metric values arrive formatted with their units
+BRAND_TEMPLATE = """Brand: {brand}
+Price per serving: ₹{price_per_serving}
+Protein per serving: {protein_g}g
+Energy per serving: {energy_kcal} kcal
+Protein %: {protein_pct}
+Protein per 100 kcal: {protein_per_100_kcal}
+EAAs %: {eaas_pct}
+Leucine per serving: {leucine_g}g
+Amino spiking suspected: {spiking}
+
+Score: {score}%
+Rejected: {rejected}
+Rejection Reason: {rejection_reason}"""
+
+
+def format_metric(value: Optional[float], unit: str, scale: float = 1.0) -> str:
+    """Format a computed metric to one decimal with its unit, or 'N/A' when missing."""
+    if value is None:
+        return "N/A"
+    return f"{value * scale:.1f}{unit}"
+
+
+def format_stored_metric(value, unit: str) -> str:
+    """Append a unit to a metric as stored in the database, or 'N/A' when missing."""
+    if value is None:
+        return "N/A"
+    return f"{value}{unit}"
+
 
 def generate_explanation_from_data(brand_name: str, brand_data: dict, scores, mode: str) -> str:
     """Generate AI explanation from in-memory data (no DB required).
@@ -63,8 +185,6 @@ def generate_explanation_from_data(brand_name: str, brand_data: dict, scores, mo
     Returns:
         Generated explanation string
     """
-    model = genai.GenerativeModel("gemini-2.0-flash")
-    
     # Extract data from brand_data
     product_info = brand_data.get("product_info", {}) or {}
     nutrients = brand_data.get("nutrients", {}).get("extracted_fields", {}) or {}
@@ -72,34 +192,31 @@ def generate_explanation_from_data(brand_name: str, brand_data: dict, scores, mo
     # Get score info
     mode_score = getattr(scores, f"{mode}_score", None)
     score_val = mode_score.total_score if mode_score else 0
-    score_val = mode_score.total_score if mode_score else 0
     rejected = mode_score.hard_rejected if mode_score else False
     rejection_reason = mode_score.rejection_reason if mode_score and rejected else None
     
     # Build prompt with available data
-    prompt = f"""{SCORING_CONTEXT}
-
-Now explain the {mode.upper()} score for this protein powder brand:
-
-Brand: {brand_name}
-Price per serving: ₹{product_info.get('price_per_serving', 'N/A')}
-Protein per serving: {nutrients.get('protein_g_per_serving', 'N/A')}g
-Energy per serving: {nutrients.get('energy_kcal_per_serving', 'N/A')} kcal
-Protein %: {scores.metrics.protein_pct:.1f}% if scores.metrics.protein_pct else 'N/A'
-Protein per 100 kcal: {scores.metrics.protein_per_100_kcal:.1f}g if scores.metrics.protein_per_100_kcal else 'N/A'
-EAAs %: {scores.metrics.eaas_pct * 100:.1f}% if scores.metrics.eaas_pct else 'N/A'
-Leucine per serving: {scores.metrics.leucine_g_per_serving or 'N/A'}g
-Amino spiking suspected: {'Yes' if scores.amino_spiking.suspected else 'No'}
-
-Score: {round(score_val * 100)}%
-Score: {round(score_val * 100)}%
-Rejected: {'Yes' if rejected else 'No'}
-Rejection Reason: {rejection_reason if rejection_reason else 'N/A'}
-
-Provide a concise 2-3 sentence explanation of why this brand got this {mode} score. Focus on the key factors that influenced the score. Be specific about what's good or bad about this product for someone in {mode} mode. Use plain language."""
-
-    response = model.generate_content(prompt)
-    return response.text.strip()
+    m = scores.metrics
+    prompt = EXPLANATION_PROMPT_TEMPLATE.format(
+        mode=mode,
+        mode_upper=mode.upper(),
+        brand_block=BRAND_TEMPLATE.format(
+            brand=brand_name,
+            price_per_serving=product_info.get('price_per_serving', 'N/A'),
+            protein_g=nutrients.get('protein_g_per_serving', 'N/A'),
+            energy_kcal=nutrients.get('energy_kcal_per_serving', 'N/A'),
+            protein_pct=format_metric(m.protein_pct, "%"),
+            protein_per_100_kcal=format_metric(m.protein_per_100_kcal, "g"),
+            eaas_pct=format_metric(m.eaas_pct, "%", scale=100),
+            leucine_g=m.leucine_g_per_serving or 'N/A',
+            spiking='Yes' if scores.amino_spiking.suspected else 'No',
+            score=round(score_val * 100),
+            rejected='Yes' if rejected else 'No',
+            rejection_reason=rejection_reason if rejection_reason else 'N/A',
+        ),
+    )
+    
+    return generate_text(prompt)
 
 
 def generate_brand_explanations(brand_name: str, brand_data: dict, scores) -> dict:
@@ -116,12 +233,17 @@ def generate_brand_explanations(brand_name: str, brand_data: dict, scores) -> di
     explanations = {}
     modes = ['cut', 'bulk', 'clean']
     
-    for mode in modes:
+    # The three calls are independent network round trips, so overlap them;
+    # three requests at once stays well inside Gemini's per-minute quota
+    with ThreadPoolExecutor(max_workers=len(modes)) as executor:
+        futures = {
+            mode: executor.submit(generate_explanation_from_data, brand_name, brand_data, scores, mode)
+            for mode in modes
+        }
+    
+    for mode, future in futures.items():
         try:
-            explanation = generate_explanation_from_data(brand_name, brand_data, scores, mode)
-            explanations[mode] = explanation
-            # Rate limiting - Gemini has quotas
-            time.sleep(0.5)
+            explanations[mode] = future.result()
         except Exception as e:
             explanations[mode] = f"Error generating explanation: {e}"
     
@@ -134,38 +256,113 @@ def get_leaderboard_data(supabase):
     return result.data
 
 
-def generate_explanation(brand: dict, mode: str) -> str:
-    """Generate AI explanation for a brand's score in a specific mode."""
-    model = genai.GenerativeModel("gemini-2.0-flash")
-    
-    score_key = f"{mode}_score"
+def format_leaderboard_brand(brand: dict, mode: str) -> str:
+    """Format a leaderboard row's fields and mode score for an explanation prompt."""
     score_key = f"{mode}_score"
     rejected_key = f"{mode}_rejected"
     reason_key = f"{mode}_rejection_reason"
     
+    return BRAND_TEMPLATE.format(
+        brand=brand['brand'],
+        price_per_serving=brand.get('price_per_serving', 'N/A'),
+        protein_g=brand.get('protein_g', 'N/A'),
+        energy_kcal=brand.get('energy_kcal', 'N/A'),
+        protein_pct=format_stored_metric(brand.get('protein_pct'), "%"),
+        protein_per_100_kcal=format_stored_metric(brand.get('protein_per_100_kcal'), "g"),
+        eaas_pct=format_stored_metric(brand.get('eaas_pct'), "%"),
+        leucine_g=brand.get('leucine_g_per_serving', 'N/A'),
+        spiking='Yes' if brand.get('amino_spiking_suspected') else 'No',
+        score=round(brand.get(score_key, 0) * 100),
+        rejected='Yes' if brand.get(rejected_key) else 'No',
+        rejection_reason=brand.get(reason_key) if brand.get(rejected_key) else 'N/A',
+    )
+
+
+def leaderboard_explanation_prompt(brand: dict, mode: str) -> str:
+    """Build the single-brand explanation prompt for a leaderboard row."""
+    return EXPLANATION_PROMPT_TEMPLATE.format(
+        mode=mode,
+        mode_upper=mode.upper(),
+        brand_block=format_leaderboard_brand(brand, mode),
+    )
+
+
+def generate_explanation(brand: dict, mode: str) -> str:
+    """Generate AI explanation for a brand's score in a specific mode."""
+    return generate_text(leaderboard_explanation_prompt(brand, mode))
+
+
+def generate_explanations_batched(brands: list[dict], mode: str) -> list[str]:
+    """Generate explanations for several brands' scores in one mode with one call.
+    
+    SCORING_CONTEXT is sent once for the whole batch instead of once per brand.
+    
+    Args:
+        brands: Leaderboard rows
+        mode: 'cut', 'bulk', or 'clean'
+    
+    Returns:
+        Explanations in the same order as brands
+    
+    Raises:
+        ValueError: If the response is not a JSON object with one explanation per brand
+    """
+    blocks = "\n\n".join(
+        f"--- Brand {i} ---\n{format_leaderboard_brand(brand, mode)}"
+        for i, brand in enumerate(brands, 1)
+    )
     prompt = f"""{SCORING_CONTEXT}
 
-Now explain the {mode.upper()} score for this protein powder brand:
+Now explain the {mode.upper()} score for each of these {len(brands)} protein powder brands:
 
-Brand: {brand['brand']}
-Price per serving: ₹{brand.get('price_per_serving', 'N/A')}
-Protein per serving: {brand.get('protein_g', 'N/A')}g
-Energy per serving: {brand.get('energy_kcal', 'N/A')} kcal
-Protein %: {brand.get('protein_pct', 'N/A')}%
-Protein per 100 kcal: {brand.get('protein_per_100_kcal', 'N/A')}g
-EAAs %: {brand.get('eaas_pct', 'N/A')}%
-Leucine per serving: {brand.get('leucine_g_per_serving', 'N/A')}g
-Amino spiking suspected: {'Yes' if brand.get('amino_spiking_suspected') else 'No'}
+{blocks}
 
-Score: {round(brand.get(score_key, 0) * 100)}%
-Score: {round(brand.get(score_key, 0) * 100)}%
-Rejected: {'Yes' if brand.get(rejected_key) else 'No'}
-Rejection Reason: {brand.get(reason_key) if brand.get(rejected_key) else 'N/A'}
+For each brand, provide a concise 2-3 sentence explanation of why it got this {mode} score. Focus on the key factors that influenced the score. Be specific about what's good or bad about each product for someone in {mode} mode. Use plain language.
 
-Provide a concise 2-3 sentence explanation of why this brand got this {mode} score. Focus on the key factors that influenced the score. Be specific about what's good or bad about this product for someone in {mode} mode. Use plain language."""
+Respond with only a JSON object mapping each brand number to its explanation, like {{"1": "...", "2": "..."}}."""
+
+    def parse(text: str) -> list[str]:
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        try:
+            explanations = json.loads(text)
+            return [explanations[str(i)].strip() for i in range(1, len(brands) + 1)]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed batched explanation response: {e}") from e
+    
+    return generate_text(prompt, parse)
+
+
+# Limits for the bulk generate_all_explanations run
+EXPLANATION_WORKERS = 10
+EXPLANATION_MAX_RPM = 60
+EXPLANATION_BATCH_SIZE = 8
+EXPLANATION_INSERT_BATCH = 32
+
+
+def upsert_explanations(supabase, rows: list[dict]):
+    """Store explanation rows in one request, replacing any stored for the same brand and mode.
+    
+    Upserting keeps a duplicate from a concurrent run from rejecting the
+    whole request, and with it explanations that were already paid for.
+    """
+    supabase.table("explanations").upsert(rows, on_conflict="brand_id,mode").execute()
 
-    response = model.generate_content(prompt)
-    return response.text.strip()
+
+def find_missing_explanations(supabase, brands: list[dict], modes: list[str]) -> dict[str, list[dict]]:
+    """Return the brands that still need an explanation, per mode."""
+    # Fetch every existing (brand_id, mode) pair in one request
+    existing_rows = supabase.table("explanations").select("brand_id, mode").execute().data
+    existing = {(row["brand_id"], row["mode"]) for row in existing_rows}
+    
+    pending = {mode: [] for mode in modes}
+    for brand in brands:
+        for mode in modes:
+            if (brand['id'], mode) in existing:
+                print(f"  ⏭️  {brand['brand']} ({mode}): already exists")
+                continue
+            pending[mode].append(brand)
+    return pending
 
 
 def generate_all_explanations():
@@ -178,40 +375,155 @@ def generate_all_explanations():
     
     print(f"Generating explanations for {len(brands)} brands × {len(modes)} modes = {len(brands) * len(modes)} total")
     
-    for brand in brands:
-        brand_id = brand['id']
-        brand_name = brand['brand']
+    pending = find_missing_explanations(supabase, brands, modes)
+    
+    # Each request explains a batch of brands in one mode, sharing the scoring
+    # context; batches run concurrently under a shared rate limit
+    batches = [
+        (mode, mode_brands[i:i + EXPLANATION_BATCH_SIZE])
+        for mode, mode_brands in pending.items()
+        for i in range(0, len(mode_brands), EXPLANATION_BATCH_SIZE)
+    ]
+    # Generated rows are buffered and stored EXPLANATION_INSERT_BATCH at a time
+    rows = []
+    labels = []
+    
+    def flush():
+        try:
+            upsert_explanations(supabase, rows)
+            for label in labels:
+                print(f"  🤖 {label}: ✅")
+        except Exception as e:
+            for label in labels:
+                print(f"  🤖 {label}: ❌ Error: {e}")
+        rows.clear()
+        labels.clear()
+    
+    limiter = RateLimiter(EXPLANATION_MAX_RPM)
+    with ThreadPoolExecutor(max_workers=EXPLANATION_WORKERS) as executor:
+        futures = {
+            executor.submit(call_with_retry, limiter, generate_explanations_batched, batch, mode): (mode, batch)
+            for mode, batch in batches
+        }
         
-        for mode in modes:
-            # Check if explanation already exists
-            existing = supabase.table("explanations").select("id").eq("brand_id", brand_id).eq("mode", mode).execute()
-            
-            if existing.data:
-                print(f"  ⏭️  {brand_name} ({mode}): already exists")
+        for future in as_completed(futures):
+            mode, batch = futures[future]
+            try:
+                explanations = future.result()
+            except Exception as e:
+                for brand in batch:
+                    print(f"  🤖 {brand['brand']} ({mode}): ❌ Error: {e}")
                 continue
             
-            try:
-                print(f"  🤖 {brand_name} ({mode}): generating...", end=" ", flush=True)
-                explanation = generate_explanation(brand, mode)
-                
-                # Store in database
-                supabase.table("explanations").insert({
-                    "brand_id": brand_id,
+            for brand, explanation in zip(batch, explanations):
+                rows.append({
+                    "brand_id": brand['id'],
                     "mode": mode,
                     "explanation": explanation
-                }).execute()
-                
-                print("✅")
-                
-                # Rate limiting - Gemini has quotas
-                time.sleep(1)
-                
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                continue
+                })
+                labels.append(f"{brand['brand']} ({mode})")
+            if len(rows) >= EXPLANATION_INSERT_BATCH:
+                flush()
+    
+    if rows:
+        flush()
     
     print("\n✅ Done generating explanations!")
 
 
+# Seconds between status checks of a Gemini batch job
+BATCH_POLL_INTERVAL = 30
+
+
+def generate_all_explanations_batch_job():
+    """Generate missing explanations through a Gemini batch job.
+    
+    For offline reruns: batch jobs are billed at a discount and are not
+    bound by the per-minute quota, but may take up to 24 hours to finish.
+    """
+    from google import genai as google_genai
+    
+    supabase = get_supabase_client()
+    
+    brands = get_leaderboard_data(supabase)
+    modes = ['cut', 'bulk', 'clean']
+    
+    pending = find_missing_explanations(supabase, brands, modes)
+    
+    # Rows are stored EXPLANATION_INSERT_BATCH at a time, so a failed
+    # request loses only its own chunk
+    rows = []
+    stored = 0
+    
+    def flush() -> int:
+        try:
+            upsert_explanations(supabase, rows)
+            count = len(rows)
+        except Exception as e:
+            print(f"  ❌ Error storing {len(rows)} explanations: {e}")
+            count = 0
+        rows.clear()
+        return count
+    
+    # Serve unchanged prompts from the response cache; only the rest are submitted
+    work = []
+    for mode, mode_brands in pending.items():
+        for brand in mode_brands:
+            prompt = leaderboard_explanation_prompt(brand, mode)
+            cached = cached_response(prompt)
+            if cached is not None:
+                rows.append({"brand_id": brand['id'], "mode": mode, "explanation": cached})
+                if len(rows) >= EXPLANATION_INSERT_BATCH:
+                    stored += flush()
+            else:
+                work.append((brand, mode, prompt))
+    total = stored + len(rows) + len(work)
+    # Store cached rows before the job, which may take hours
+    if rows:
+        stored += flush()
+    if not work:
+        print(f"\n✅ Stored {stored} cached explanations, nothing to generate")
+        return
+    
+    client = google_genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+    job = client.batches.create(
+        model=EXPLANATION_MODEL,
+        src=[
+            {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+            for _, _, prompt in work
+        ],
+        config={"display_name": "protein-analyser-explanations"},
+    )
+    print(f"Submitted batch job {job.name} with {len(work)} requests")
+    
+    done_states = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+    while job.state.name not in done_states:
+        time.sleep(BATCH_POLL_INTERVAL)
+        job = client.batches.get(name=job.name)
+        print(f"  ⏳ {job.state.name}")
+    
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        print(f"❌ Batch job ended in {job.state.name}: {job.error}")
+        return
+    
+    # Inlined responses come back in request order
+    for (brand, mode, prompt), item in zip(work, job.dest.inlined_responses):
+        if item.error or not item.response:
+            print(f"  🤖 {brand['brand']} ({mode}): ❌ Error: {item.error}")
+            continue
+        explanation = item.response.text.strip()
+        cache_response(prompt, explanation)
+        rows.append({"brand_id": brand['id'], "mode": mode, "explanation": explanation})
+        if len(rows) >= EXPLANATION_INSERT_BATCH:
+            stored += flush()
+    
+    if rows:
+        stored += flush()
+    print(f"\n✅ Stored {stored} of {total} explanations")
+
+
 if __name__ == "__main__":
-    generate_all_explanations()
+    if "--batch" in sys.argv:
+        generate_all_explanations_batch_job()
+    else:
+        generate_all_explanations()
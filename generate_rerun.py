@@ -1,5 +1,6 @@
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -14,9 +15,16 @@ def generate_commands():
     print("# Commands to regenerate analysis for all brands using stored parameters")
     print("# Generated by Antigravity\n")
 
-    for brand_dir in sorted(output_dir.iterdir()):
-        if not brand_dir.is_dir() or brand_dir.name.startswith("."):
-            continue
+    # scandir's entries carry the d_type, so is_dir() needs no extra stat
+    with os.scandir(output_dir) as entries:
+        brand_names = sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+    
+    for brand_name in brand_names:
+        brand_dir = output_dir / brand_name
         
         json_path = brand_dir / f"{brand_dir.name}.json"
         if not json_path.exists():
@@ -7,11 +7,22 @@ Implements the scoring_spec.yml logic to score brands across different goals:
 - clean: Optimize for clean eating (low sodium, low additives)
 """
 
+import bisect
+import functools
 import json
+import operator
+import os
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional, Literal
+from types import MappingProxyType
+from typing import Callable, Iterator, Optional, Literal
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SpecLoader
+except ImportError:
+    from yaml import SafeLoader as SpecLoader
 
 
 # Load scoring spec
@@ -19,7 +30,159 @@ SKILLS_DIR = Path(__file__).parent / "skills"
 SCORING_SPEC_PATH = SKILLS_DIR / "scoring_spec.yml"
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def load_spec(spec_path: str) -> dict:
+    """Parse a scoring spec file once per process.
+    
+    Every Scorer built from the same file shares the returned dict, so it
+    must be treated as read-only.
+    """
+    with open(spec_path) as f:
+        return yaml.load(f, Loader=SpecLoader)["scoring_spec"]
+
+
+# Range operators produced by parse_range
+OP_GE, OP_GT, OP_LE, OP_LT, OP_RANGE, OP_EQ = range(6)
+
+
+@functools.lru_cache(maxsize=None)
+def parse_range(range_str: str) -> tuple[int, float, float]:
+    """Parse a range string like '<65', '65-72', '>80' or '40-45%'.
+    
+    Returns:
+        (operator, low, high); high is only used by OP_RANGE
+    """
+    range_str = range_str.replace("%", "")  # Remove percentage signs
+    
+    if range_str.startswith(">="):
+        return OP_GE, float(range_str[2:]), 0.0
+    elif range_str.startswith(">"):
+        return OP_GT, float(range_str[1:]), 0.0
+    elif range_str.startswith("<="):
+        return OP_LE, float(range_str[2:]), 0.0
+    elif range_str.startswith("<"):
+        return OP_LT, float(range_str[1:]), 0.0
+    elif "-" in range_str:
+        low, high = range_str.split("-")
+        return OP_RANGE, float(low), float(high)
+    else:
+        return OP_EQ, float(range_str), 0.0
+
+
+def range_matches(value: float, op: int, low: float, high: float) -> bool:
+    """Check a value against a parsed range."""
+    if op == OP_GE:
+        return value >= low
+    elif op == OP_GT:
+        return value > low
+    elif op == OP_LE:
+        return value <= low
+    elif op == OP_LT:
+        return value < low
+    elif op == OP_RANGE:
+        return low <= value <= high
+    else:
+        return value == low
+
+
+def compile_ranges(ranges: dict) -> list[tuple[int, float, float, float]]:
+    """Compile a {range_str: score} mapping into (op, low, high, score) tuples, in order."""
+    return [(*parse_range(range_str), score) for range_str, score in ranges.items()]
+
+
+def _first_match(compiled: list, value: float) -> float:
+    for op, low, high, score in compiled:
+        if range_matches(value, op, low, high):
+            return score
+    return 0.0
+
+
+def build_range_table(ranges: dict) -> tuple[tuple, tuple, tuple]:
+    """Build a bisect lookup table equivalent to a first-match scan over ranges.
+    
+    Spec buckets share their boundaries (e.g. '65-72' and '72-80' both hold 72),
+    so each boundary point gets its own score, and each open gap between
+    boundaries gets the score any value inside it would match.
+    
+    Returns:
+        (boundaries, boundary_scores, gap_scores), where gap_scores[i] covers
+        the values between boundaries[i - 1] and boundaries[i]
+    """
+    compiled = compile_ranges(ranges)
+    boundaries = sorted({bound for op, low, high, _ in compiled for bound in ((low, high) if op == OP_RANGE else (low,))})
+    
+    gap_points = [boundaries[0] - 1.0]
+    gap_points += [(a + b) / 2 for a, b in zip(boundaries, boundaries[1:])]
+    gap_points.append(boundaries[-1] + 1.0)
+    
+    return (
+        tuple(boundaries),
+        tuple(_first_match(compiled, point) for point in boundaries),
+        tuple(_first_match(compiled, point) for point in gap_points),
+    )
+
+
+def make_range_scorer(table: tuple[tuple, tuple, tuple], inverted: bool = False) -> Callable[[float], float]:
+    """Specialize a build_range_table table into a one-argument scoring function.
+    
+    The table is bound into the closure, so a lookup is one bisect with no
+    dict or attribute access.
+    
+    Args:
+        table: Table from build_range_table
+        inverted: Return 1 - score, for penalties derived from normalization ranges
+    """
+    boundaries, boundary_scores, gap_scores = table
+    nan_score = 0.0
+    if inverted:
+        boundary_scores = tuple(1.0 - score for score in boundary_scores)
+        gap_scores = tuple(1.0 - score for score in gap_scores)
+        nan_score = 1.0
+    count = len(boundaries)
+    find = bisect.bisect_left
+    
+    def score_value(value: float) -> float:
+        idx = find(boundaries, value)
+        if idx < count and boundaries[idx] == value:
+            return boundary_scores[idx]
+        if value != value:  # NaN matches no bucket
+            return nan_score
+        return gap_scores[idx]
+    
+    return score_value
+
+
+def make_range_predicate(range_str: str) -> Callable[[float], bool]:
+    """Compile a range string like '<20' into a predicate over a native float."""
+    op, low, high = parse_range(range_str)
+    if op == OP_GE:
+        return lambda value: value >= low
+    elif op == OP_GT:
+        return lambda value: value > low
+    elif op == OP_LE:
+        return lambda value: value <= low
+    elif op == OP_LT:
+        return lambda value: value < low
+    elif op == OP_RANGE:
+        return lambda value: low <= value <= high
+    else:
+        return lambda value: value == low
+
+
+# Scoring modes, in BrandScores field order
+MODES = ("cut", "bulk", "clean")
+
+# Shared read-only default for missing sections of brand data
+_EMPTY = MappingProxyType({})
+
+# Label quality bits of ComputedMetrics.flags
+FLAG_MISSING_MACROS = 1
+FLAG_SODIUM_ZERO = 2
+FLAG_HEAVY_METALS_UNTESTED = 4
+CREDIBILITY_FLAGS = FLAG_MISSING_MACROS | FLAG_SODIUM_ZERO
+
+
+@dataclass(slots=True)
 class ComputedMetrics:
     """Computed metrics from brand data."""
     protein_pct: Optional[float] = None
@@ -30,16 +193,28 @@ class ComputedMetrics:
     non_protein_macros_g: Optional[float] = None
     leucine_g_per_serving: Optional[float] = None
     protein_g_per_serving: Optional[float] = None
-    protein_g_per_serving: Optional[float] = None
     sodium_mg: Optional[float] = None
     added_sugar_g: Optional[float] = None
     taurine_g: Optional[float] = None
     heavy_metals_tested: Optional[bool] = None
     missing_macros: bool = False
     sodium_reported_zero: bool = False
+    
+    @property
+    def flags(self) -> int:
+        """FLAG_* bits for the label quality fields, tested against per-mode masks."""
+        flags = 0
+        if self.missing_macros:
+            flags |= FLAG_MISSING_MACROS
+        if self.sodium_reported_zero:
+            flags |= FLAG_SODIUM_ZERO
+        # Unknown (None) counts as untested
+        if not self.heavy_metals_tested:
+            flags |= FLAG_HEAVY_METALS_UNTESTED
+        return flags
 
 
-@dataclass
+@dataclass(slots=True)
 class AminoSpikingResult:
     """Result of amino spiking detection."""
     suspected: bool = False
@@ -47,7 +222,7 @@ class AminoSpikingResult:
     glycine_ratio: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeScore:
     """Score for a specific mode (cut/bulk/clean)."""
     mode: str
@@ -58,7 +233,7 @@ class ModeScore:
     penalty_deduction: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandScores:
     """Complete scoring result for a brand."""
     brand: str
@@ -69,6 +244,21 @@ class BrandScores:
     clean_score: Optional[ModeScore] = None
 
 
+def metric_getter(names: tuple[str, ...]):
+    """Build a function returning the named ComputedMetrics values as a tuple.
+    
+    Uses one operator.attrgetter call when every name is a ComputedMetrics
+    field; names that are not fields read as None, like getattr(..., None).
+    """
+    known = {f.name for f in fields(ComputedMetrics)}
+    if names and all(name in known for name in names):
+        getter = operator.attrgetter(*names)
+        if len(names) == 1:
+            return lambda metrics: (getter(metrics),)
+        return getter
+    return lambda metrics: tuple(getattr(metrics, name, None) for name in names)
+
+
 class Scorer:
     """
     Scoring engine that implements scoring_spec.yml logic.
@@ -76,63 +266,126 @@ class Scorer:
     
     def __init__(self, spec_path: Path = SCORING_SPEC_PATH):
         """Load scoring specification."""
-        with open(spec_path) as f:
-            self.spec = yaml.safe_load(f)["scoring_spec"]
+        self.spec = load_spec(str(spec_path))
         
         self.normalization_ranges = self.spec["normalization_ranges"]
         self.penalties = self.spec["penalties"]
         self.modes = self.spec["modes"]
         self.spiking_rules = self.spec["amino_spiking_detection"]
+        
+        # Range strings compiled once into per-metric scoring functions with
+        # first-match semantics. Metrics without penalty ranges are penalized
+        # by their inverted normalization score (Score 1.0 = Penalty 0.0).
+        norm_tables = {
+            metric: build_range_table(ranges) for metric, ranges in self.normalization_ranges.items() if ranges
+        }
+        self._norm_funcs = {metric: make_range_scorer(table) for metric, table in norm_tables.items()}
+        self._penalty_funcs = {
+            metric: make_range_scorer(table, inverted=True) for metric, table in norm_tables.items()
+        }
+        self._penalty_funcs.update(
+            (metric, make_range_scorer(build_range_table(ranges)))
+            for metric, ranges in self.penalties.items() if ranges
+        )
+        
+        # Per-mode (metric, weight, scoring function) plans so score_mode skips the spec lookups,
+        # plus getters that read each plan's metric values in one call
+        self._mode_plan = {}
+        self._mode_penalty_plan = {}
+        self._mode_values = {}
+        self._mode_penalty_values = {}
+        for mode, mode_spec in self.modes.items():
+            self._mode_plan[mode] = tuple(
+                (metric_name, weight, self._norm_funcs.get(metric_name))
+                for metric_name, weight in mode_spec.get("weights", {}).items()
+            )
+            self._mode_penalty_plan[mode] = tuple(
+                (metric_name, weight, self._penalty_funcs.get(metric_name))
+                for metric_name, weight in mode_spec.get("penalty_weights", {}).items()
+            )
+            self._mode_values[mode] = metric_getter(tuple(entry[0] for entry in self._mode_plan[mode]))
+            self._mode_penalty_values[mode] = metric_getter(tuple(entry[0] for entry in self._mode_penalty_plan[mode]))
+        
+        # Per-mode hard reject rules in spec order, and the flag masks each mode acts on
+        self._hard_reject_plan = {mode: self._compile_hard_reject(mode_spec) for mode, mode_spec in self.modes.items()}
+        credibility_effects = self.spec.get("label_credibility", {}).get("effects", {})
+        safety_enforcement = self.spec.get("safety_flags", {}).get("enforcement", {})
+        self._credibility_reject_mask = {}
+        self._credibility_penalty_mask = {}
+        self._credibility_penalty = {}
+        self._safety_reject_mask = {}
+        for mode in self.modes:
+            effects = credibility_effects.get(mode, {})
+            self._credibility_reject_mask[mode] = CREDIBILITY_FLAGS if effects.get("hard_reject") else 0
+            self._credibility_penalty_mask[mode] = CREDIBILITY_FLAGS if "penalty" in effects else 0
+            self._credibility_penalty[mode] = 0.0 + effects.get("penalty", 0.0)
+            enforcement = safety_enforcement.get(mode, {})
+            self._safety_reject_mask[mode] = FLAG_HEAVY_METALS_UNTESTED if enforcement.get("hard_reject_if_unknown") else 0
+    
+    def _compile_hard_reject(self, mode_spec: dict) -> tuple[tuple[Optional[str], Optional[Callable], str], ...]:
+        """Compile a mode's hard_reject rules into (metric, predicate, reason) tuples.
+        
+        The amino spiking rule has no metric or predicate; it rejects when
+        spiking is suspected.
+        """
+        plan = []
+        for metric_name, threshold in mode_spec.get("hard_reject", {}).items():
+            if metric_name == "amino_spiking_suspected":
+                if threshold:
+                    plan.append((None, None, "amino_spiking_suspected"))
+            elif metric_name == "added_sugar_present":
+                # TODO: implement added sugar detection
+                pass
+            else:
+                plan.append((metric_name, make_range_predicate(threshold), f"{metric_name} {threshold}"))
+        return tuple(plan)
     
     def load_brand_data(self, brand_json_path: Path) -> dict:
         """Load brand extraction data from JSON."""
-        with open(brand_json_path) as f:
-            return json.load(f)
+        return json.loads(Path(brand_json_path).read_bytes())
     
     def compute_metrics(self, data: dict) -> ComputedMetrics:
         """Compute all metrics from brand data."""
-        nutrients = data.get("nutrients", {}).get("extracted_fields", {})
-        aminoacids = data.get("aminoacids", {}).get("extracted_fields", {})
+        nutrients = data.get("nutrients", _EMPTY).get("extracted_fields", _EMPTY)
+        aminoacids = data.get("aminoacids", _EMPTY).get("extracted_fields", _EMPTY)
         
         # Get base values
-        serving_size_g = nutrients.get("serving_size_g")
-        protein_g = nutrients.get("protein_g_per_serving")
-        energy_kcal = nutrients.get("energy_kcal_per_serving")
-        carbs_g = nutrients.get("carbohydrates_g_per_serving")
-        fat_g = nutrients.get("total_fat_g_per_serving")
-        sodium_mg = nutrients.get("sodium_mg_per_serving")
-        added_sugar_g = nutrients.get("added_sugar_g_per_serving")
-        heavy_metals_tested = nutrients.get("heavy_metals_tested")
+        n_get = nutrients.get
+        serving_size_g = n_get("serving_size_g")
+        protein_g = n_get("protein_g_per_serving")
+        energy_kcal = n_get("energy_kcal_per_serving")
+        carbs_g = n_get("carbohydrates_g_per_serving")
+        fat_g = n_get("total_fat_g_per_serving")
+        sodium_mg = n_get("sodium_mg_per_serving")
+        added_sugar_g = n_get("added_sugar_g_per_serving")
+        heavy_metals_tested = n_get("heavy_metals_tested")
         
         # Get amino acid values
-        eaas = aminoacids.get("eaas", {})
-        bcaas = eaas.get("bcaas", {})
-        seaas = aminoacids.get("seaas", {})
+        a_get = aminoacids.get
+        eaas = a_get("eaas", _EMPTY)
+        bcaas = eaas.get("bcaas", _EMPTY)
+        seaas = a_get("seaas", _EMPTY)
         
         # Normalize amino acids to per_serving if needed
-        serving_basis = aminoacids.get("serving_basis", "per_serving")
+        serving_basis = a_get("serving_basis", "per_serving")
         normalization_factor = 1.0
         if serving_basis == "per_100g" and serving_size_g:
             normalization_factor = serving_size_g / 100
         
         eaas_g = eaas.get("total_g")
-        bcaas_g = bcaas.get("total_g")
-        leucine_g = bcaas.get("leucine_g")
-        leucine_g = bcaas.get("leucine_g")
-        glycine_g = seaas.get("glycine_g")
-        taurine_g = seaas.get("taurine_g")
-        
-        # Apply normalization
-        if eaas_g and normalization_factor != 1.0:
-            eaas_g *= normalization_factor
-        if bcaas_g and normalization_factor != 1.0:
-            bcaas_g *= normalization_factor
-        if leucine_g and normalization_factor != 1.0:
-            leucine_g *= normalization_factor
-        if glycine_g and normalization_factor != 1.0:
-            glycine_g *= normalization_factor
-        if taurine_g and normalization_factor != 1.0:
-            taurine_g *= normalization_factor
+        bcaas_get = bcaas.get
+        bcaas_g = bcaas_get("total_g")
+        leucine_g = bcaas_get("leucine_g")
+        seaas_get = seaas.get
+        glycine_g = seaas_get("glycine_g")
+        taurine_g = seaas_get("taurine_g")
+        
+        # Apply normalization (missing and zero values stay as they are)
+        if normalization_factor != 1.0:
+            eaas_g, bcaas_g, leucine_g, glycine_g, taurine_g = (
+                value * normalization_factor if value else value
+                for value in (eaas_g, bcaas_g, leucine_g, glycine_g, taurine_g)
+            )
         
         metrics = ComputedMetrics()
         
@@ -174,8 +427,8 @@ class Scorer:
         result = AminoSpikingResult()
         
         # Get glycine for ratio calculation
-        aminoacids = data.get("aminoacids", {}).get("extracted_fields", {})
-        seaas = aminoacids.get("seaas", {})
+        aminoacids = data.get("aminoacids", _EMPTY).get("extracted_fields", _EMPTY)
+        seaas = aminoacids.get("seaas", _EMPTY)
         glycine_g = seaas.get("glycine_g")
         
         if glycine_g and metrics.protein_g_per_serving:
@@ -212,135 +465,71 @@ class Scorer:
         if value is None:
             return 0.0
         
-        ranges = self.normalization_ranges.get(metric_name, {})
-        if not ranges:
+        score_value = self._norm_funcs.get(metric_name)
+        if score_value is None:
             return 0.0
         
-        # Parse ranges and find matching bucket
-        for range_str, score in ranges.items():
-            if self._value_matches_range(value, range_str):
-                return score
-        
-        return 0.0
+        return score_value(value)
     
     def get_penalty_value(self, metric_name: str, value: Optional[float]) -> float:
         """Get penalty value for a metric."""
         if value is None:
             return 0.0
         
-        penalty_ranges = self.penalties.get(metric_name, {})
-        if not penalty_ranges:
-            # Fallback: check normalization_ranges and invert (Score 1.0 = Penalty 0.0)
-            norm_ranges = self.normalization_ranges.get(metric_name)
-            if norm_ranges:
-                score = self.normalize_value(metric_name, value)
-                return 1.0 - score
+        # Includes the inverted normalization fallback for metrics without penalty ranges
+        penalty_value = self._penalty_funcs.get(metric_name)
+        if penalty_value is None:
             return 0.0
         
-        for range_str, penalty in penalty_ranges.items():
-            if self._value_matches_range(value, range_str):
-                return penalty
-        
-        return 0.0
+        return penalty_value(value)
     
     def _value_matches_range(self, value: float, range_str: str) -> bool:
         """Check if value matches a range string like '<65', '65-72', '>80'."""
-        range_str = range_str.replace("%", "")  # Remove percentage signs
-        
-        if range_str.startswith(">="):
-            threshold = float(range_str[2:])
-            return value >= threshold
-        elif range_str.startswith(">"):
-            threshold = float(range_str[1:])
-            return value > threshold
-        elif range_str.startswith("<="):
-            threshold = float(range_str[2:])
-            return value <= threshold
-        elif range_str.startswith("<"):
-            threshold = float(range_str[1:])
-            return value < threshold
-        elif "-" in range_str:
-            low, high = range_str.split("-")
-            return float(low) <= value <= float(high)
-        else:
-            return value == float(range_str)
-    
-    def _check_hard_reject(self, mode_spec: dict, metrics: ComputedMetrics, 
+        return range_matches(value, *parse_range(range_str))
+    
+    def _check_hard_reject(self, mode: str, metrics: ComputedMetrics, 
                           amino_spiking: AminoSpikingResult) -> tuple[bool, Optional[str]]:
         """Check if brand should be hard rejected for this mode."""
-        hard_reject = mode_spec.get("hard_reject", {})
-        
-        for metric_name, threshold in hard_reject.items():
-            if metric_name == "amino_spiking_suspected":
-                if threshold and amino_spiking.suspected:
-                    return True, "amino_spiking_suspected"
-            elif metric_name == "added_sugar_present":
-                # TODO: implement added sugar detection
-                pass
+        for metric_name, predicate, reason in self._hard_reject_plan[mode]:
+            if predicate is None:
+                if amino_spiking.suspected:
+                    return True, reason
             else:
                 value = getattr(metrics, metric_name, None)
-                if value is not None and self._value_matches_range(value, threshold):
-                    return True, f"{metric_name} {threshold}"
+                if value is not None and predicate(value):
+                    return True, reason
         
         return False, None
 
     def _apply_label_credibility_penalties(self, mode: str, metrics: ComputedMetrics) -> float:
         """Calculate score deduction from label credibility issues."""
-        spec = self.spec.get("label_credibility", {})
-        effects = spec.get("effects", {}).get(mode, {})
-        
-        penalty = 0.0
-        
-        # Check credibility flags
-        flags_triggered = []
-        if metrics.missing_macros:
-            flags_triggered.append("missing_macros")
-        if metrics.sodium_reported_zero:
-            flags_triggered.append("sodium_reported_zero")
-        
-        # Apply mode-specific effects
-        if flags_triggered:
-            # Check for hard reject in clean mode
-            if effects.get("hard_reject") and flags_triggered:
-                # This return logic needs to be handled in score_mode via a separate check
-                # For now, we return 1.0 penalty to simulate hard reject if needed, 
-                # but better to handle rejection explicitly. 
-                # Let's just return the numeric penalty here.
-                pass
-                
-            if "penalty" in effects:
-                penalty += effects["penalty"]
-                
-        return penalty
+        # Hard rejects for these flags are handled by _check_credibility_reject
+        if metrics.flags & self._credibility_penalty_mask[mode]:
+            return self._credibility_penalty[mode]
+        return 0.0
 
     def _check_credibility_reject(self, mode: str, metrics: ComputedMetrics) -> bool:
         """Check if label credibility issues cause a hard reject."""
-        spec = self.spec.get("label_credibility", {})
-        effects = spec.get("effects", {}).get(mode, {})
-        
-        if effects.get("hard_reject"):
-            if metrics.missing_macros or metrics.sodium_reported_zero:
-                return True
-        return False
+        return bool(metrics.flags & self._credibility_reject_mask[mode])
 
     def _check_safety_reject(self, mode: str, metrics: ComputedMetrics) -> bool:
         """Check if safety flags cause a hard reject."""
-        spec = self.spec.get("safety_flags", {})
-        enforcement = spec.get("enforcement", {}).get(mode, {})
-        
-        if enforcement.get("hard_reject_if_unknown"):
-            # If heavy metals tested is None (unknown) or False, reject
-            if not metrics.heavy_metals_tested:
-                return True
-        return False
+        # If heavy metals tested is None (unknown) or False, reject
+        return bool(metrics.flags & self._safety_reject_mask[mode])
     
     def score_mode(self, mode: str, metrics: ComputedMetrics, 
-                   amino_spiking: AminoSpikingResult) -> ModeScore:
-        """Score a brand for a specific mode."""
-        mode_spec = self.modes[mode]
-        
+                   amino_spiking: AminoSpikingResult, detailed: bool = True) -> ModeScore:
+        """Score a brand for a specific mode.
+        
+        Args:
+            mode: Mode name (cut/bulk/clean)
+            metrics: Computed brand metrics
+            amino_spiking: Spiking detection result
+            detailed: Fill component_scores with the per-metric breakdown;
+                False returns only the totals
+        """
         # Check hard rejection
-        rejected, reason = self._check_hard_reject(mode_spec, metrics, amino_spiking)
+        rejected, reason = self._check_hard_reject(mode, metrics, amino_spiking)
         if rejected:
             return ModeScore(
                 mode=mode,
@@ -368,45 +557,52 @@ class Scorer:
             )
         
         # Calculate weighted score
-        weights = mode_spec.get("weights", {})
         component_scores = {}
         total_score = 0.0
         
-        for metric_name, weight in weights.items():
-            value = getattr(metrics, metric_name, None)
-            normalized = self.normalize_value(metric_name, value)
-            component_scores[metric_name] = {
-                "raw_value": value,
-                "normalized": normalized,
-                "weight": weight,
-                "contribution": normalized * weight
-            }
+        plan_values = zip(self._mode_plan[mode], self._mode_values[mode](metrics))
+        for (metric_name, weight, score_value), value in plan_values:
+            if value is None or score_value is None:
+                normalized = 0.0
+            else:
+                normalized = score_value(value)
+            if detailed:
+                component_scores[metric_name] = {
+                    "raw_value": value,
+                    "normalized": normalized,
+                    "weight": weight,
+                    "contribution": normalized * weight
+                }
             total_score += normalized * weight
         
         # Apply penalties (for cut and bulk modes)
-        penalty_weights = mode_spec.get("penalty_weights", {})
         total_penalty = 0.0
         
-        for metric_name, weight in penalty_weights.items():
-            value = getattr(metrics, metric_name, None)
-            penalty = self.get_penalty_value(metric_name, value)
-            component_scores[f"penalty_{metric_name}"] = {
-                "raw_value": value,
-                "penalty": penalty,
-                "weight": weight,
-                "deduction": penalty * weight
-            }
+        penalty_values = zip(self._mode_penalty_plan[mode], self._mode_penalty_values[mode](metrics))
+        for (metric_name, weight, penalty_value), value in penalty_values:
+            if value is None or penalty_value is None:
+                penalty = 0.0
+            else:
+                penalty = penalty_value(value)
+            if detailed:
+                component_scores[f"penalty_{metric_name}"] = {
+                    "raw_value": value,
+                    "penalty": penalty,
+                    "weight": weight,
+                    "deduction": penalty * weight
+                }
             total_penalty += penalty * weight
             
         # Apply label credibility penalty (NEW v1.4)
         credibility_penalty = self._apply_label_credibility_penalties(mode, metrics)
         if credibility_penalty > 0:
-            component_scores["penalty_label_credibility"] = {
-                "raw_value": 1.0,
-                "penalty": credibility_penalty,
-                "weight": 1.0, 
-                "deduction": credibility_penalty
-            }
+            if detailed:
+                component_scores["penalty_label_credibility"] = {
+                    "raw_value": 1.0,
+                    "penalty": credibility_penalty,
+                    "weight": 1.0, 
+                    "deduction": credibility_penalty
+                }
             total_penalty += credibility_penalty
         
         # Apply penalty deduction: final = base * (1 - penalty)
@@ -419,8 +615,16 @@ class Scorer:
             penalty_deduction=round(total_penalty, 4)
         )
     
-    def score_brand(self, data: dict) -> BrandScores:
-        """Score a brand across all modes."""
+    def score_brand(self, data: dict, detailed: bool = True,
+                    modes: tuple[str, ...] = MODES) -> BrandScores:
+        """Score a brand across the requested modes.
+        
+        Args:
+            data: Brand extraction data
+            detailed: Fill each ModeScore's component_scores; False returns
+                only the totals, which is all leaderboards need
+            modes: Modes to score; the other <mode>_score fields are left None
+        """
         brand = data.get("brand", "unknown")
         
         # Compute metrics
@@ -429,18 +633,16 @@ class Scorer:
         # Detect amino spiking
         amino_spiking = self.detect_amino_spiking(metrics, data)
         
-        # Score all modes
-        cut_score = self.score_mode("cut", metrics, amino_spiking)
-        bulk_score = self.score_mode("bulk", metrics, amino_spiking)
-        clean_score = self.score_mode("clean", metrics, amino_spiking)
+        # Score the requested modes
+        mode_scores = {
+            f"{mode}_score": self.score_mode(mode, metrics, amino_spiking, detailed) for mode in modes
+        }
         
         return BrandScores(
             brand=brand,
             metrics=metrics,
             amino_spiking=amino_spiking,
-            cut_score=cut_score,
-            bulk_score=bulk_score,
-            clean_score=clean_score,
+            **mode_scores,
         )
     
     def score_brand_from_file(self, json_path: Path) -> BrandScores:
@@ -449,37 +651,99 @@ class Scorer:
         return self.score_brand(data)
 
 
-def score_all_brands(output_dir: Path = Path("output")) -> list[BrandScores]:
-    """Score all brands in the output directory."""
-    scorer = Scorer()
-    results = []
+def _iter_brand_json_paths(root: Path) -> Iterator[Path]:
+    """Yield the <brand>/<brand>.json path of every brand directory under root.
     
-    for brand_dir in output_dir.iterdir():
-        if not brand_dir.is_dir() or brand_dir.name.startswith("."):
-            continue
-        
-        json_path = brand_dir / f"{brand_dir.name}.json"
-        if json_path.exists():
-            scores = scorer.score_brand_from_file(json_path)
-            results.append(scores)
+    Uses os.scandir so directory checks come from the cached dirent type
+    rather than a stat() per entry.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            yield Path(entry.path) / f"{entry.name}.json"
+
+
+# Below this many brands, process startup costs more than the scoring it spreads out
+SCORE_POOL_MIN_BRANDS = 32
+
+
+@functools.lru_cache(maxsize=1)
+def _get_scorer() -> Scorer:
+    """Return this process's Scorer, loading the scoring spec once."""
+    return Scorer()
+
+
+def _load_and_score_file(json_path: Path, detailed: bool = False,
+                         modes: tuple[str, ...] = MODES) -> Optional[tuple[dict, BrandScores]]:
+    """Load and score one brand JSON with the process's Scorer; None if the file is missing."""
+    scorer = _get_scorer()
+    try:
+        data = scorer.load_brand_data(json_path)
+    except FileNotFoundError:
+        return None
+    return data, scorer.score_brand(data, detailed, modes)
+
+
+def load_and_score_files(json_paths: list[Path], detailed: bool = False,
+                         modes: tuple[str, ...] = MODES,
+                         max_workers: Optional[int] = None) -> list[Optional[tuple[dict, BrandScores]]]:
+    """Load and score brand JSON files in order.
+    
+    Large batches are scored across a process pool, since scoring is
+    CPU-bound Python; smaller ones stay in this process.
+    
+    Args:
+        json_paths: Brand extraction files
+        detailed: Fill component_scores; leaderboards only need the totals
+        modes: Modes to score
+        max_workers: Pool size (defaults to the CPU count)
+    
+    Returns:
+        (data, scores) for each path, or None where the file is missing
+    """
+    if len(json_paths) < SCORE_POOL_MIN_BRANDS or max_workers == 1:
+        return [_load_and_score_file(json_path, detailed, modes) for json_path in json_paths]
     
-    return results
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            _load_and_score_file, json_paths,
+            [detailed] * len(json_paths), [modes] * len(json_paths), chunksize=8
+        ))
+
+
+def score_all_brands(output_dir: Path = Path("output"), detailed: bool = False,
+                     max_workers: Optional[int] = None,
+                     modes: tuple[str, ...] = MODES) -> list[BrandScores]:
+    """Score all brands in the output directory, in directory scan order.
+    
+    Args:
+        output_dir: Directory of <brand>/<brand>.json extractions
+        detailed: Fill component_scores; leaderboards only need the totals
+        max_workers: Pool size for large directories (defaults to the CPU count)
+        modes: Modes to score, e.g. (mode,) for a single leaderboard
+    """
+    json_paths = list(_iter_brand_json_paths(output_dir))
+    results = load_and_score_files(json_paths, detailed, modes, max_workers)
+    return [result[1] for result in results if result is not None]
 
 
 def get_leaderboard(results: list[BrandScores], mode: str = "cut") -> list[tuple[str, float, bool]]:
     """Get sorted leaderboard for a mode."""
-    leaderboard = []
+    entries = []
     
     for scores in results:
         mode_score = getattr(scores, f"{mode}_score")
         if mode_score:
-            leaderboard.append((
-                scores.brand,
-                mode_score.total_score,
-                mode_score.hard_rejected
+            rejected = mode_score.hard_rejected
+            entries.append((
+                (0 if rejected else 1, mode_score.total_score),
+                (scores.brand, mode_score.total_score, rejected),
             ))
     
     # Sort by score descending, rejected brands at bottom
-    leaderboard.sort(key=lambda x: (not x[2], x[1]), reverse=True)
+    entries.sort(key=operator.itemgetter(0), reverse=True)
     
-    return leaderboard
+    return [row for _, row in entries]
@@ -0,0 +1,4 @@
+-- Add content_hash to brands so db_builder can skip unchanged brands
+-- Run this in Supabase SQL Editor (databases created before this column existed)
+
+ALTER TABLE brands ADD COLUMN IF NOT EXISTS content_hash TEXT;
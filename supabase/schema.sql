@@ -15,6 +15,7 @@ CREATE TABLE brands (
     servings_per_pack REAL,
     price_per_serving REAL,
     extraction_timestamp TIMESTAMPTZ,
+    content_hash TEXT,
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
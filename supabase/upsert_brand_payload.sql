@@ -0,0 +1,100 @@
+-- Upsert a brand and all of its child rows in one call
+-- Run this in Supabase SQL Editor (after schema.sql and add_explanations.sql;
+-- existing databases also need add_content_hash.sql)
+--
+-- Called by db_builder.push_brand via supabase.rpc("upsert_brand_payload", ...).
+-- payload keys: brand, nutrients, aminoacids, scores (row objects, brand_id
+-- is filled in here) and explanations ({mode: text}). Missing or null child
+-- objects leave the existing rows untouched.
+
+CREATE OR REPLACE FUNCTION upsert_brand_payload(payload JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    bid INTEGER;
+BEGIN
+    INSERT INTO brands (
+        name, weight_kg, price_inr, price_per_kg,
+        servings_per_pack, price_per_serving, extraction_timestamp, content_hash
+    )
+    SELECT
+        name, weight_kg, price_inr, price_per_kg,
+        servings_per_pack, price_per_serving, extraction_timestamp, content_hash
+    FROM jsonb_populate_record(NULL::brands, payload->'brand')
+    ON CONFLICT (name) DO UPDATE SET
+        weight_kg = EXCLUDED.weight_kg,
+        price_inr = EXCLUDED.price_inr,
+        price_per_kg = EXCLUDED.price_per_kg,
+        servings_per_pack = EXCLUDED.servings_per_pack,
+        price_per_serving = EXCLUDED.price_per_serving,
+        extraction_timestamp = EXCLUDED.extraction_timestamp,
+        content_hash = EXCLUDED.content_hash
+    RETURNING id INTO bid;
+
+    IF jsonb_typeof(payload->'nutrients') = 'object' THEN
+        DELETE FROM nutrients WHERE brand_id = bid;
+        INSERT INTO nutrients (
+            brand_id, serving_size_g, energy_kcal, protein_g, carbohydrates_g,
+            total_fat_g, sodium_mg, added_sugar_g, heavy_metals_tested,
+            extraction_confidence
+        )
+        SELECT
+            bid, serving_size_g, energy_kcal, protein_g, carbohydrates_g,
+            total_fat_g, sodium_mg, added_sugar_g, heavy_metals_tested,
+            extraction_confidence
+        FROM jsonb_populate_record(NULL::nutrients, payload->'nutrients');
+    END IF;
+
+    IF jsonb_typeof(payload->'aminoacids') = 'object' THEN
+        DELETE FROM aminoacids WHERE brand_id = bid;
+        INSERT INTO aminoacids (
+            brand_id, serving_basis,
+            eaas_total_g, bcaas_total_g, leucine_g, isoleucine_g, valine_g,
+            lysine_g, methionine_g, phenylalanine_g, threonine_g, tryptophan_g, histidine_g,
+            seaas_total_g, arginine_g, cysteine_g, glycine_g, proline_g, tyrosine_g,
+            neaas_total_g, serine_g, alanine_g, aspartic_acid_g, glutamic_acid_g,
+            extraction_confidence
+        )
+        SELECT
+            bid, serving_basis,
+            eaas_total_g, bcaas_total_g, leucine_g, isoleucine_g, valine_g,
+            lysine_g, methionine_g, phenylalanine_g, threonine_g, tryptophan_g, histidine_g,
+            seaas_total_g, arginine_g, cysteine_g, glycine_g, proline_g, tyrosine_g,
+            neaas_total_g, serine_g, alanine_g, aspartic_acid_g, glutamic_acid_g,
+            extraction_confidence
+        FROM jsonb_populate_record(NULL::aminoacids, payload->'aminoacids');
+    END IF;
+
+    IF jsonb_typeof(payload->'scores') = 'object' THEN
+        DELETE FROM scores WHERE brand_id = bid;
+        INSERT INTO scores (
+            brand_id, protein_pct, protein_per_100_kcal, eaas_pct, bcaas_pct_of_eaas,
+            non_protein_macros_g, leucine_g_per_serving,
+            amino_spiking_suspected, spiking_rules_triggered,
+            cut_score, cut_rejected, cut_rejection_reason,
+            bulk_score, bulk_rejected, bulk_rejection_reason,
+            clean_score, clean_rejected, clean_rejection_reason
+        )
+        SELECT
+            bid, protein_pct, protein_per_100_kcal, eaas_pct, bcaas_pct_of_eaas,
+            non_protein_macros_g, leucine_g_per_serving,
+            amino_spiking_suspected, spiking_rules_triggered,
+            cut_score, cut_rejected, cut_rejection_reason,
+            bulk_score, bulk_rejected, bulk_rejection_reason,
+            clean_score, clean_rejected, clean_rejection_reason
+        FROM jsonb_populate_record(NULL::scores, payload->'scores');
+    END IF;
+
+    IF jsonb_typeof(payload->'explanations') = 'object' THEN
+        INSERT INTO explanations (brand_id, mode, explanation)
+        SELECT bid, key, value
+        FROM jsonb_each_text(payload->'explanations')
+        ON CONFLICT (brand_id, mode) DO UPDATE SET
+            explanation = EXCLUDED.explanation,
+            generated_at = NOW();
+    END IF;
+
+    RETURN bid;
+END;
+$$;
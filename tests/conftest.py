@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
+import jsonschema
 import pytest
 
 # Test fixtures directory
@@ -15,28 +16,46 @@ PROJECT_DIR = Path(__file__).parent.parent
 SKILLS_DIR = PROJECT_DIR / "skills"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_nutrition_schema() -> dict:
-    """Load the nutrition extraction schema."""
+    """Load the nutrition extraction schema, once per session (treat as read-only)."""
     schema_path = SKILLS_DIR / "extract_nutrition_label_v1.schema.json"
-    return json.loads(schema_path.read_text())
+    return json.loads(schema_path.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_aminoacid_schema() -> dict:
-    """Load the amino acid extraction schema."""
+    """Load the amino acid extraction schema, once per session (treat as read-only)."""
     schema_path = SKILLS_DIR / "extract_aminoacid_profile_v1.schema.json"
-    return json.loads(schema_path.read_text())
+    return json.loads(schema_path.read_bytes())
 
 
-@pytest.fixture
+def _checked_validator(schema: dict) -> jsonschema.protocols.Validator:
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@pytest.fixture(scope="session")
+def nutrition_validator(sample_nutrition_schema: dict) -> jsonschema.protocols.Validator:
+    """Validator for the nutrition schema, checked against its metaschema once."""
+    return _checked_validator(sample_nutrition_schema)
+
+
+@pytest.fixture(scope="session")
+def aminoacid_validator(sample_aminoacid_schema: dict) -> jsonschema.protocols.Validator:
+    """Validator for the amino acid schema, checked against its metaschema once."""
+    return _checked_validator(sample_aminoacid_schema)
+
+
+@pytest.fixture(scope="session")
 def sample_nutrition_prompt() -> str:
     """Load the nutrition extraction prompt."""
     prompt_path = SKILLS_DIR / "extract_nutrition_label_v1.prompt.md"
     return prompt_path.read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_aminoacid_prompt() -> str:
     """Load the amino acid extraction prompt."""
     prompt_path = SKILLS_DIR / "extract_aminoacid_profile_v1.prompt.md"
@@ -154,6 +173,29 @@ def mock_openai_response(valid_nutrition_output: dict):
     return mock_response
 
 
+@pytest.fixture(scope="session")
+def _shared_openai_extractor():
+    """One NutritionExtractor built against a mocked OpenAI client.
+    
+    The client is created in __init__, so the environment and class patches
+    only need to be active while the extractor is constructed.
+    """
+    from extractors import NutritionExtractor
+    
+    client = MagicMock()
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"}), patch("openai.OpenAI", return_value=client):
+        extractor = NutritionExtractor(provider="openai")
+    return extractor, client
+
+
+@pytest.fixture
+def openai_extractor(_shared_openai_extractor):
+    """The shared (extractor, mock client) pair, with the mock reset for each test."""
+    extractor, client = _shared_openai_extractor
+    client.reset_mock(return_value=True, side_effect=True)
+    return extractor, client
+
+
 @pytest.fixture
 def mock_gemini_response(valid_nutrition_output: dict):
     """Mock Gemini API response."""
@@ -177,6 +219,23 @@ def sample_image_path() -> Path:
     return FIXTURES_DIR / "sample_label.png"
 
 
+@pytest.fixture(scope="session")
+def scorer():
+    """One Scorer for the whole session, so the scoring spec is parsed once."""
+    from scorer import Scorer
+    return Scorer()
+
+
+@pytest.fixture
+def brand_data(valid_nutrition_output, valid_aminoacid_output) -> dict:
+    """Brand JSON as written by the CLI, built from the valid extraction outputs."""
+    return {
+        "brand": "test_brand",
+        "nutrients": valid_nutrition_output,
+        "aminoacids": valid_aminoacid_output,
+    }
+
+
 def pytest_addoption(parser):
     """Add custom pytest options."""
     parser.addoption(
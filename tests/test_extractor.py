@@ -6,18 +6,16 @@ These tests run without API calls using mocked responses.
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import jsonschema
 import pytest
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from extractors import (
     NutritionExtractor,
     AminoacidExtractor,
     ExtractionResult,
+    extract_brand,
     get_extractor,
     detect_profile_type,
     get_brand_from_path,
@@ -105,17 +103,22 @@ class TestAminoacidExtractor:
     
     def test_file_patterns(self):
         assert "aminoacid_profile.*" in AminoacidExtractor.FILE_PATTERNS
+    
+    def test_find_image_prefers_earlier_pattern(self, tmp_path):
+        """Earlier FILE_PATTERNS win and non-image files are ignored."""
+        for name in ("amino.webp", "aminoacid_profile.txt", "aminoacid_profile.jpeg"):
+            (tmp_path / name).write_bytes(b"")
+        assert AminoacidExtractor.find_image(tmp_path) == tmp_path / "aminoacid_profile.jpeg"
 
 
 class TestNutritionSchemaValidation:
     """Tests for nutrition JSON schema validation."""
     
-    def test_valid_output_passes_validation(self, sample_nutrition_schema, valid_nutrition_output):
+    def test_valid_output_passes_validation(self, nutrition_validator, valid_nutrition_output):
         """Valid extraction output should pass schema validation."""
-        try:
-            jsonschema.validate(valid_nutrition_output, sample_nutrition_schema)
-        except jsonschema.ValidationError as e:
-            pytest.fail(f"Valid output failed validation: {e.message}")
+        # is_valid skips building errors; best_match only runs to explain a failure
+        assert nutrition_validator.is_valid(valid_nutrition_output), \
+            jsonschema.exceptions.best_match(nutrition_validator.iter_errors(valid_nutrition_output)).message
     
     def test_invalid_output_fails_validation(self, sample_nutrition_schema, invalid_extraction_output):
         """Invalid extraction output should fail schema validation."""
@@ -138,12 +141,10 @@ class TestNutritionSchemaValidation:
 class TestAminoacidSchemaValidation:
     """Tests for amino acid JSON schema validation."""
     
-    def test_valid_output_passes_validation(self, sample_aminoacid_schema, valid_aminoacid_output):
+    def test_valid_output_passes_validation(self, aminoacid_validator, valid_aminoacid_output):
         """Valid amino acid extraction output should pass schema validation."""
-        try:
-            jsonschema.validate(valid_aminoacid_output, sample_aminoacid_schema)
-        except jsonschema.ValidationError as e:
-            pytest.fail(f"Valid amino acid output failed validation: {e.message}")
+        assert aminoacid_validator.is_valid(valid_aminoacid_output), \
+            jsonschema.exceptions.best_match(aminoacid_validator.iter_errors(valid_aminoacid_output)).message
     
     def test_invalid_serving_basis_fails(self, sample_aminoacid_schema, valid_aminoacid_output):
         """Invalid serving_basis enum value should fail."""
@@ -170,6 +171,23 @@ class TestExtractorValidation:
         valid, errors = extractor.validate_output(invalid_extraction_output)
         assert valid is False
         assert len(errors) > 0
+    
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_validate_reports_same_error_as_jsonschema(self, invalid_extraction_output):
+        """Cached validator should report the error jsonschema.validate raises."""
+        extractor = NutritionExtractor()
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            jsonschema.validate(invalid_extraction_output, extractor.schema)
+        valid, errors = extractor.validate_output(invalid_extraction_output)
+        assert valid is False
+        assert errors == [exc_info.value.message]
+    
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_validate_without_collecting_errors(self, valid_nutrition_output, invalid_extraction_output):
+        """collect_errors=False should only report validity."""
+        extractor = NutritionExtractor()
+        assert extractor.validate_output(valid_nutrition_output, collect_errors=False) == (True, [])
+        assert extractor.validate_output(invalid_extraction_output, collect_errors=False) == (False, [])
 
 
 class TestPromptLoading:
@@ -191,6 +209,15 @@ class TestPromptLoading:
         assert len(prompt) > 0
         assert "amino" in prompt.lower()
     
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_warm_loads_prompt_and_schema(self):
+        """warm() should cache the prompt, schema and a validator shared across instances."""
+        extractor = NutritionExtractor()
+        extractor.warm()
+        assert extractor._prompt is not None
+        assert extractor._schema is not None
+        assert NutritionExtractor().validator is extractor.validator
+    
     @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
     def test_nutrition_prompt_contains_key_instructions(self):
         """Nutrition prompt should contain key extraction instructions."""
@@ -209,21 +236,17 @@ class TestPromptLoading:
 class TestMockedExtraction:
     """Tests using mocked API responses."""
     
-    @patch('openai.OpenAI')
-    @patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'})
-    def test_openai_extraction_flow(self, mock_openai_class, mock_openai_response, tmp_path):
+    def test_openai_extraction_flow(self, openai_extractor, mock_openai_response, tmp_path):
         """Test extraction flow with mocked OpenAI response."""
         # Create a dummy image file
         test_image = tmp_path / "nutrients_profile.png"
         test_image.write_bytes(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01')
         
         # Setup mock
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
+        extractor, mock_client = openai_extractor
         mock_client.chat.completions.create.return_value = mock_openai_response
         
         # Run extraction
-        extractor = NutritionExtractor(provider="openai")
         result = extractor.extract(test_image, "test_product")
         
         # Verify
@@ -232,6 +255,145 @@ class TestMockedExtraction:
         assert result.provider == "openai"
         assert result.profile_type == "nutrients"
         assert result.extracted_fields["protein_g_per_serving"] == 25
+    
+    @patch('extractors.ratelimit.time.sleep')
+    @patch.object(NutritionExtractor, "extract")
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_extract_many_keeps_order_and_retries_429(self, mock_extract, mock_sleep):
+        """extract_many returns results in input order, retries rate-limit errors and passes collect_errors."""
+        rate_limited = Exception("quota exceeded")
+        rate_limited.code = 429
+        calls = []
+        
+        def fake_extract(image_path, product_id, collect_errors):
+            assert collect_errors is False
+            calls.append(product_id)
+            if calls.count("a") == 1 and product_id == "a":
+                raise rate_limited
+            return f"result_{product_id}"
+        
+        mock_extract.side_effect = fake_extract
+        
+        extractor = NutritionExtractor()
+        items = [("a.png", "a"), ("b.png", "b"), ("c.png", "c")]
+        results = extractor.extract_many(items, max_rpm=6000, collect_errors=False)
+        
+        assert results == ["result_a", "result_b", "result_c"]
+        assert calls.count("a") == 2
+
+
+class TestImageEncoding:
+    """Tests for label image encoding."""
+    
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_encode_image_reencodes_changed_file(self, tmp_path):
+        """Encoded images are cached, but a rewritten file is encoded again."""
+        test_image = tmp_path / "nutrients_profile.jpg"
+        test_image.write_bytes(b"first")
+        extractor = NutritionExtractor()
+        assert extractor._encode_image(test_image) == ("Zmlyc3Q=", "image/jpeg")
+        
+        test_image.write_bytes(b"second!")
+        assert extractor._encode_image(test_image) == ("c2Vjb25kIQ==", "image/jpeg")
+    
+    def test_encode_image_downscales_large_images(self, tmp_path):
+        """Images past MAX_IMAGE_EDGE are sent as downscaled JPEGs."""
+        import base64
+        import io
+        
+        import PIL.Image
+        
+        from extractors.base import MAX_IMAGE_EDGE, encode_image
+        
+        test_image = tmp_path / "nutrients_profile.png"
+        PIL.Image.new("RGBA", (4000, 2000), (255, 255, 255, 255)).save(test_image)
+        stat = test_image.stat()
+        
+        image_data, mime_type = encode_image(str(test_image), stat.st_mtime_ns, stat.st_size)
+        
+        assert mime_type == "image/jpeg"
+        decoded = PIL.Image.open(io.BytesIO(base64.b64decode(image_data)))
+        assert max(decoded.size) == MAX_IMAGE_EDGE
+
+
+class TestExtractBrand:
+    """Tests for extract_brand orchestration."""
+    
+    @patch.object(AminoacidExtractor, "extract")
+    @patch.object(NutritionExtractor, "extract")
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_extracts_both_profiles(self, mock_nutrition, mock_amino, tmp_path):
+        """Both profiles found in the brand directory should be extracted."""
+        (tmp_path / "nutrients_profile.png").write_bytes(b"")
+        (tmp_path / "aminoacid_profile.png").write_bytes(b"")
+        
+        def make_result(profile_type: str) -> ExtractionResult:
+            return ExtractionResult(
+                product_id=f"{tmp_path.name}_{profile_type}",
+                profile_type=profile_type,
+                extracted_fields={},
+                raw_evidence={},
+                quality={},
+                provider="gemini",
+                model="gemini-2.0-flash",
+                valid=True,
+            )
+        
+        mock_nutrition.return_value = make_result("nutrients")
+        mock_amino.return_value = make_result("aminoacid")
+        
+        result = extract_brand(tmp_path)
+        
+        assert result.brand == tmp_path.name
+        assert result.nutrients["profile_type"] == "nutrients"
+        assert result.aminoacids["profile_type"] == "aminoacid"
+        mock_nutrition.assert_called_once_with(tmp_path / "nutrients_profile.png", f"{tmp_path.name}_nutrients")
+        mock_amino.assert_called_once_with(tmp_path / "aminoacid_profile.png", f"{tmp_path.name}_aminoacid")
+    
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_no_images_found(self, tmp_path):
+        """A directory without label images yields an empty result."""
+        result = extract_brand(tmp_path)
+        
+        assert result.nutrients is None
+        assert result.aminoacids is None
+
+
+class TestAminoacidTotals:
+    """Tests for AminoacidExtractor total computation."""
+    
+    @staticmethod
+    def make_result(fields: dict) -> ExtractionResult:
+        return ExtractionResult(
+            product_id="test_aminoacid",
+            profile_type="aminoacid",
+            extracted_fields=fields,
+            raw_evidence={},
+            quality={},
+            provider="gemini",
+            model="gemini-2.0-flash",
+            valid=True,
+        )
+    
+    @patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'})
+    def test_computes_missing_totals(self):
+        """Null totals should be filled from complete individual values."""
+        fields = {
+            "eaas": {
+                "total_g": None,
+                "bcaas": {"total_g": None, "leucine_g": 2.5, "isoleucine_g": 1.5, "valine_g": 1.25},
+                "lysine_g": 2.0, "methionine_g": 0.5, "phenylalanine_g": 0.75,
+                "threonine_g": 1.25, "tryptophan_g": 0.25, "histidine_g": 0.5,
+            },
+            "neaas": {"total_g": None, "serine_g": 1.0, "alanine_g": None},
+        }
+        result = AminoacidExtractor()._compute_totals(self.make_result(fields))
+        
+        eaas = result.extracted_fields["eaas"]
+        assert eaas["bcaas"]["total_g"] == 5.25
+        assert eaas["total_g"] == 10.5
+        assert result.extracted_fields["neaas"]["total_g"] is None
+        assert result.quality["computed_fields"] == ["eaas.bcaas.total_g=5.250", "eaas.total_g=10.500"]
 
 
 class TestExtractionResult:
@@ -7,35 +7,43 @@ Run with: pytest tests/test_integration.py -v --run-integration
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from extractor import NutritionExtractor, detect_profile_type, get_brand_from_path
+from extractors import NutritionExtractor, detect_profile_type, get_brand_from_path
 
 # Project paths
 PROJECT_DIR = Path(__file__).parent.parent
 IMAGES_DIR = PROJECT_DIR / "images"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def real_image_path() -> Path:
-    """Get a real test image from the images directory."""
+    """Get a real test image from the images directory, once per session."""
     if not IMAGES_DIR.exists():
         pytest.skip("No images directory found")
     
-    for brand_dir in IMAGES_DIR.iterdir():
-        if brand_dir.is_dir() and not brand_dir.name.startswith("."):
-            nutrients_img = brand_dir / "nutrients_profile.png"
-            if nutrients_img.exists():
-                return nutrients_img
+    # scandir entries carry the d_type, so only candidate images are stat()ed
+    with os.scandir(IMAGES_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir() and not entry.name.startswith("."):
+                nutrients_img = Path(entry.path) / "nutrients_profile.png"
+                if nutrients_img.exists():
+                    return nutrients_img
     
     pytest.skip("No test images found")
 
 
+@pytest.fixture(scope="session")
+def openai_nutrition_extractor() -> NutritionExtractor:
+    """One OpenAI NutritionExtractor per session, so its HTTP connection pool is reused."""
+    if not os.getenv("OPENAI_API_KEY"):
+        pytest.skip("OPENAI_API_KEY not set")
+    return NutritionExtractor(provider="openai")
+
+
 @pytest.mark.integration
 class TestOpenAIIntegration:
     """Integration tests using OpenAI API."""
@@ -46,9 +54,9 @@ class TestOpenAIIntegration:
         if not os.getenv("OPENAI_API_KEY"):
             pytest.skip("OPENAI_API_KEY not set")
     
-    def test_extract_nutrients_profile(self, real_image_path):
+    def test_extract_nutrients_profile(self, real_image_path, openai_nutrition_extractor):
         """Test real extraction from nutrients profile image."""
-        extractor = NutritionExtractor(provider="openai")
+        extractor = openai_nutrition_extractor
         
         brand = get_brand_from_path(real_image_path)
         product_id = f"{brand}_nutrients"
@@ -131,8 +139,11 @@ class TestProviderComparison:
         openai_extractor = NutritionExtractor(provider="openai")
         gemini_extractor = NutritionExtractor(provider="gemini")
         
-        openai_result = openai_extractor.extract(real_image_path, product_id)
-        gemini_result = gemini_extractor.extract(real_image_path, product_id)
+        # The two API calls are independent I/O, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            openai_future = executor.submit(openai_extractor.extract, real_image_path, product_id)
+            gemini_future = executor.submit(gemini_extractor.extract, real_image_path, product_id)
+            openai_result, gemini_result = openai_future.result(), gemini_future.result()
         
         # Log comparison
         print(f"\n--- Provider Comparison ---")
@@ -149,18 +160,18 @@ class TestProviderComparison:
         o_fields = openai_result.extracted_fields
         g_fields = gemini_result.extracted_fields
         
-        # Log differences
-        differences = []
-        for key in o_fields:
-            o_val = o_fields.get(key)
-            g_val = g_fields.get(key)
-            if o_val != g_val:
-                differences.append(f"{key}: OpenAI={o_val}, Gemini={g_val}")
+        # Log differences, including fields only one provider returned
+        # (dicts keep insertion order, so OpenAI's fields come first)
+        all_keys = dict.fromkeys(o_fields) | dict.fromkeys(g_fields)
+        differences = {
+            key: (o_fields.get(key), g_fields.get(key))
+            for key in all_keys
+            if o_fields.get(key) != g_fields.get(key)
+        }
         
         if differences:
             print(f"\nDifferences found:")
-            for diff in differences:
-                print(f"  - {diff}")
+            print("\n".join(f"  - {key}: OpenAI={o_val}, Gemini={g_val}" for key, (o_val, g_val) in differences.items()))
 
 
 @pytest.mark.integration
@@ -175,14 +186,13 @@ class TestGoldenFiles:
         if not os.getenv("OPENAI_API_KEY"):
             pytest.skip("OPENAI_API_KEY not set")
     
-    def test_origin_plant_protein(self):
+    def test_origin_plant_protein(self, openai_nutrition_extractor):
         """Test extraction against known values for OriginPlantProtein."""
         image_path = IMAGES_DIR / "OriginPlantProtein" / "nutrients_profile.png"
         if not image_path.exists():
             pytest.skip("OriginPlantProtein image not found")
         
-        extractor = NutritionExtractor(provider="openai")
-        result = extractor.extract(image_path, "OriginPlantProtein_nutrients")
+        result = openai_nutrition_extractor.extract(image_path, "OriginPlantProtein_nutrients")
         
         # Known values from the label
         expected = {
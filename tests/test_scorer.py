@@ -0,0 +1,219 @@
+"""
+Unit tests for the brand scorer.
+
+These tests run against skills/scoring_spec.yml, or small specs and
+hand-built metrics, without any brand output files.
+"""
+
+import pytest
+import yaml
+
+from scorer import (
+    SCORING_SPEC_PATH,
+    AminoSpikingResult,
+    BrandScores,
+    ComputedMetrics,
+    ModeScore,
+    Scorer,
+    build_range_table,
+    get_leaderboard,
+    make_range_predicate,
+    make_range_scorer,
+)
+
+
+class TestScorer:
+    """Tests for spec range lookups in the Scorer."""
+    
+    def test_shared_range_boundary_uses_first_bucket(self, scorer):
+        """A value on a shared boundary should score in the first listed bucket."""
+        assert scorer.normalize_value("protein_pct", 64.9) == 0.0
+        assert scorer.normalize_value("protein_pct", 65) == 0.5
+        assert scorer.normalize_value("protein_pct", 72) == 0.5
+        assert scorer.normalize_value("protein_pct", 80) == 0.8
+        assert scorer.normalize_value("protein_pct", 80.1) == 1.0
+        assert scorer.normalize_value("leucine_g_per_serving", 2.7) == 0.7
+        assert scorer.normalize_value("protein_pct", None) == 0.0
+    
+    def test_penalty_falls_back_to_inverted_normalization(self, scorer):
+        """Metrics without penalty ranges should be penalized by 1 - normalized score."""
+        metric = next(m for m in scorer.normalization_ranges if not scorer.penalties.get(m))
+        for value in (0, 50, 100, 250, 1000):
+            assert scorer.get_penalty_value(metric, value) == 1.0 - scorer.normalize_value(metric, value)
+    
+    def test_hand_built_metrics_trigger_credibility_reject(self, scorer):
+        """Label quality fields set directly on ComputedMetrics should still reject."""
+        metrics = ComputedMetrics(missing_macros=True)
+        result = scorer.score_mode("clean", metrics, AminoSpikingResult())
+        assert result.hard_rejected is True
+        assert result.rejection_reason == "label_credibility_issues"
+
+
+class TestRangeLookups:
+    """Tests for the compiled range scorers and predicates."""
+    
+    RANGES = {"<65": 0.0, "65-72": 0.5, "72-80": 0.8, ">80": 1.0}
+    
+    @pytest.mark.parametrize("value, expected", [
+        (64.99, 0.0),
+        (65, 0.5),
+        (68, 0.5),
+        (72, 0.5),
+        (72.01, 0.8),
+        (80, 0.8),
+        (80.01, 1.0),
+        (float("nan"), 0.0),
+    ])
+    def test_range_scorer_boundaries(self, value, expected):
+        """Shared boundaries score in the first listed bucket, open gaps in their bucket."""
+        assert make_range_scorer(build_range_table(self.RANGES))(value) == expected
+    
+    def test_inverted_range_scorer(self):
+        """Inverted scorers return 1 - score, and 1.0 where nothing matches."""
+        score_value = make_range_scorer(build_range_table(self.RANGES), inverted=True)
+        assert score_value(72) == 0.5
+        assert score_value(90) == 0.0
+        assert score_value(float("nan")) == 1.0
+    
+    def test_inclusive_bounds_and_unmatched_gap(self):
+        """'<=' and '>=' hold their bound; values between buckets score 0."""
+        score_value = make_range_scorer(build_range_table({"<=10": 1.0, ">=20": 0.5}))
+        assert score_value(10) == 1.0
+        assert score_value(10.01) == 0.0
+        assert score_value(19.99) == 0.0
+        assert score_value(20) == 0.5
+    
+    @pytest.mark.parametrize("range_str, value, expected", [
+        ("<18", 17.99, True),
+        ("<18", 18, False),
+        ("<=18", 18, True),
+        ("<=18", 18.01, False),
+        (">250", 250, False),
+        (">250", 250.01, True),
+        (">=250", 250, True),
+        (">=250", 249.99, False),
+        ("10-20", 10, True),
+        ("10-20", 20, True),
+        ("10-20", 9.99, False),
+        ("10-20", 20.01, False),
+        ("40-45%", 45, True),
+        ("5", 5, True),
+        ("5", 5.01, False),
+    ])
+    def test_range_predicate(self, range_str, value, expected):
+        """Predicates apply each operator with its exact edge semantics."""
+        assert make_range_predicate(range_str)(value) is expected
+
+
+class TestModeScoring:
+    """Tests for per-mode rejects, flag masks and scoring options."""
+    
+    @pytest.mark.parametrize("mode, metrics, suspected, reason", [
+        ("cut", {"protein_per_100_kcal": 17.9, "leucine_g_per_serving": 3.0}, False, "protein_per_100_kcal <18"),
+        ("cut", {"protein_per_100_kcal": 25.0, "leucine_g_per_serving": 2.1}, False, "leucine_g_per_serving <2.2"),
+        ("clean", {"sodium_mg": 251.0}, False, "sodium_mg >250"),
+        ("clean", {"sodium_mg": 100.0}, True, "amino_spiking_suspected"),
+    ])
+    def test_hard_reject_reasons(self, scorer, mode, metrics, suspected, reason):
+        """Each mode's hard_reject rules report the rule that fired."""
+        metrics = ComputedMetrics(heavy_metals_tested=True, **metrics)
+        result = scorer.score_mode(mode, metrics, AminoSpikingResult(suspected=suspected))
+        assert result.hard_rejected is True
+        assert result.rejection_reason == reason
+        assert result.total_score == 0.0
+    
+    def test_bulk_has_no_hard_rejects(self, scorer):
+        """Bulk mode scores metrics that would fail the cut and clean rules."""
+        metrics = ComputedMetrics(protein_per_100_kcal=10.0, leucine_g_per_serving=1.0, sodium_mg=500.0)
+        result = scorer.score_mode("bulk", metrics, AminoSpikingResult(suspected=True))
+        assert result.hard_rejected is False
+    
+    @pytest.mark.parametrize("flag", ["missing_macros", "sodium_reported_zero"])
+    def test_credibility_flags_reject_clean_and_penalize_cut(self, scorer, flag):
+        """Credibility issues hard reject clean mode and cost cut mode its spec penalty."""
+        flagged = ComputedMetrics(protein_per_100_kcal=25.0, heavy_metals_tested=True, **{flag: True})
+        clean = scorer.score_mode("clean", flagged, AminoSpikingResult())
+        assert clean.rejection_reason == "label_credibility_issues"
+        
+        cut = scorer.score_mode("cut", flagged, AminoSpikingResult())
+        assert cut.hard_rejected is False
+        assert cut.component_scores["penalty_label_credibility"]["deduction"] == 0.05
+    
+    def test_safety_mask_rejects_untested_heavy_metals(self, tmp_path):
+        """hard_reject_if_unknown rejects brands without heavy metals testing."""
+        spec = yaml.safe_load(SCORING_SPEC_PATH.read_text())
+        spec["scoring_spec"]["safety_flags"]["enforcement"]["clean"]["hard_reject_if_unknown"] = True
+        spec_path = tmp_path / "scoring_spec.yml"
+        spec_path.write_text(yaml.safe_dump(spec))
+        strict = Scorer(spec_path)
+        
+        for heavy_metals_tested in (None, False):
+            metrics = ComputedMetrics(heavy_metals_tested=heavy_metals_tested)
+            result = strict.score_mode("clean", metrics, AminoSpikingResult())
+            assert result.rejection_reason == "safety_flags_unmet"
+        tested = strict.score_mode("clean", ComputedMetrics(heavy_metals_tested=True), AminoSpikingResult())
+        assert tested.hard_rejected is False
+    
+    def test_score_brand_limits_modes(self, scorer, brand_data):
+        """Modes left out of modes= stay None."""
+        scores = scorer.score_brand(brand_data, modes=("cut",))
+        assert scores.cut_score is not None
+        assert scores.bulk_score is None
+        assert scores.clean_score is None
+    
+    def test_detailed_component_scores(self, scorer, brand_data):
+        """detailed=True fills the breakdown; detailed=False keeps the same totals."""
+        detailed = scorer.score_brand(brand_data)
+        totals = scorer.score_brand(brand_data, detailed=False)
+        
+        for mode in ("cut", "bulk", "clean"):
+            full = getattr(detailed, f"{mode}_score")
+            brief = getattr(totals, f"{mode}_score")
+            assert brief.component_scores == {}
+            assert (brief.total_score, brief.hard_rejected) == (full.total_score, full.hard_rejected)
+            if full.hard_rejected:
+                continue
+            for metric_name, weight in scorer.modes[mode]["weights"].items():
+                component = full.component_scores[metric_name]
+                assert component["weight"] == weight
+                assert component["contribution"] == component["normalized"] * weight
+            base = sum(
+                component["contribution"]
+                for name, component in full.component_scores.items()
+                if not name.startswith("penalty_")
+            )
+            assert full.total_score == round(base * (1 - full.penalty_deduction), 4)
+
+
+class TestLeaderboard:
+    """Tests for leaderboard ordering."""
+    
+    @staticmethod
+    def brand_scores(brand: str, score: float, rejected: bool = False) -> BrandScores:
+        """Build a BrandScores holding only a cut score."""
+        return BrandScores(
+            brand=brand,
+            metrics=ComputedMetrics(),
+            amino_spiking=AminoSpikingResult(),
+            cut_score=ModeScore(mode="cut", total_score=score, hard_rejected=rejected),
+        )
+    
+    def test_orders_by_score_with_rejected_last(self):
+        """Brands sort by score descending, with hard-rejected brands at the bottom."""
+        results = [
+            self.brand_scores("low", 0.2),
+            self.brand_scores("rejected_high", 0.9, rejected=True),
+            self.brand_scores("high", 0.8),
+            self.brand_scores("rejected_low", 0.1, rejected=True),
+        ]
+        assert get_leaderboard(results, "cut") == [
+            ("high", 0.8, False),
+            ("low", 0.2, False),
+            ("rejected_high", 0.9, True),
+            ("rejected_low", 0.1, True),
+        ]
+    
+    def test_skips_unscored_modes(self):
+        """Brands without a score for the mode are left off its leaderboard."""
+        results = [self.brand_scores("only_cut", 0.5)]
+        assert get_leaderboard(results, "bulk") == []
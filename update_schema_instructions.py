@@ -1,34 +1,18 @@
 
 import os
 from dotenv import load_dotenv
-from supabase import create_client
 
 # Load environment variables
 load_dotenv()
 
-def get_supabase_client():
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SECRET_KEY")
-    if not url or not key:
-        print("Error: Missing SUPABASE_URL or SUPABASE_SECRET_KEY")
-        return None
-    return create_client(url, key)
-
-def update_schema():
-    supabase = get_supabase_client()
-    if not supabase:
-        return
-
-    print("Updating schema...")
-
-    # SQL to add columns to nutrients table
-    add_columns_sql = """
+# SQL to add columns to nutrients table
+ADD_COLUMNS_SQL = """
     ALTER TABLE nutrients ADD COLUMN IF NOT EXISTS added_sugar_g REAL;
     ALTER TABLE nutrients ADD COLUMN IF NOT EXISTS heavy_metals_tested BOOLEAN;
     """
 
-    # SQL to recreate leaderboard view with new columns
-    recreate_view_sql = """
+# SQL to recreate leaderboard view with new columns
+RECREATE_VIEW_SQL = """
     DROP VIEW IF EXISTS leaderboard;
     
     CREATE OR REPLACE VIEW leaderboard AS
@@ -65,35 +49,44 @@ def update_schema():
     ORDER BY s.cut_score DESC NULLS LAST;
     """
 
+def apply_schema(db_url: str) -> bool:
+    """Run the migration over a direct Postgres connection (pip install -e .[bulk]).
+
+    Both scripts go in one round trip and one transaction, so a failure
+    leaves the old columns and view in place.
+
+    Returns:
+        True if the schema was updated
+    """
+    try:
+        import psycopg
+    except ImportError:
+        print("✗ psycopg is not installed. Run: pip install -e .[bulk]")
+        return False
+
     try:
-        # We can't execute multiple statements at once easily with RPC unless we wrap in a function,
-        # but supabase-py might allow raw SQL via rpc if we had a function "exec_sql".
-        # However, standard PostgREST doesn't expose raw SQL execution.
-        # We might need to use the `postgres` library if we have connection string, 
-        # OR hopefully the user has an RPC function for this?
-        
-        # Checking if we can execute raw SQL...
-        # Many Supabase implementations don't allow raw SQL from client for security.
-        # BUT, since we have the DB *Secret* Key (service role), we might be able to.
-        # Actually, Supabase-js structured client doesn't support raw SQL query directly usually.
-        
-        # PLAN B: We can try creating an RPC function via the dashboard? No, I can't access dashboard.
-        # Check if `db_builder.py` uses `execute`? No it uses `.table()...`
-        
-        # If I cannot execute SQL, I have to ask the user to run it in the SQL editor.
-        pass
-    except Exception as e:
+        with psycopg.connect(db_url) as conn:
+            conn.execute(ADD_COLUMNS_SQL + RECREATE_VIEW_SQL)
+    except psycopg.Error as e:
         print(f"Error: {e}")
+        return False
+    return True
+
+def update_schema():
+    # PostgREST can't run DDL, so the migration needs the direct connection string
+    db_url = os.getenv("SUPABASE_DB_URL")
+    if db_url:
+        print("Updating schema...")
+        if apply_schema(db_url):
+            print("✓ Schema updated")
+            return
 
-    # Wait, look at db_builder.py imports. `from supabase import create_client`.
-    # It does NOT have psycopg2.
-    
     print("---------------------------------------------------------")
-    print("IMPORTANT: Automatic schema migration via Python client is restricted.")
-    print("Please run the following SQL in your Supabase SQL Editor:")
+    print("IMPORTANT: Set SUPABASE_DB_URL to apply this migration automatically.")
+    print("Otherwise, run the following SQL in your Supabase SQL Editor:")
     print("---------------------------------------------------------")
-    print(add_columns_sql)
-    print(recreate_view_sql)
+    print(ADD_COLUMNS_SQL)
+    print(RECREATE_VIEW_SQL)
     print("---------------------------------------------------------")
 
 if __name__ == "__main__":